@@ -11,6 +11,7 @@ from homeassistant.helpers.device_registry import DeviceEntry
 
 from .const import ASUSROUTER, DOMAIN, PLATFORMS, STOP_LISTENER
 from .router import ARDevice
+from .storage import async_remove_stores
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +71,17 @@ async def async_unload_entry(
     return unload
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+) -> None:
+    """Remove AsusRouter config entry."""
+
+    _LOGGER.debug("Removing entry")
+
+    await async_remove_stores(hass, config_entry.entry_id)
+
+
 async def update_listener(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -8,6 +8,9 @@ from typing import Any
 from asusrouter.modules.aimesh import AiMeshDevice
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN, MANUFACTURER
 
 
 class AiMeshNode:
@@ -116,3 +119,20 @@ class AiMeshNode:
         """Return extra state attributes."""
 
         return self._extra_state_attributes
+
+    def device_info(self, router_mac: str) -> DeviceInfo:
+        """Return device info of the node."""
+
+        device_info = DeviceInfo(
+            identifiers={
+                (DOMAIN, self._mac),
+            },
+            name=self.native.model,
+            model=self.native.model,
+            manufacturer=MANUFACTURER,
+            sw_version=self.native.fw,
+        )
+        if router_mac != self._mac:
+            device_info["via_device"] = (DOMAIN, router_mac)
+
+        return device_info
@@ -21,7 +21,6 @@ from .const import (
     CONF_DEFAULT_HIDE_PASSWORDS,
     CONF_HIDE_PASSWORDS,
     DOMAIN,
-    MANUFACTURER,
     PASSWORD,
     STATIC_BINARY_SENSORS,
 )
@@ -146,28 +145,7 @@ class AMBinarySensor(BinarySensorEntity):
     def device_info(self) -> DeviceInfo:
         """Return device info."""
 
-        device_info: DeviceInfo = DeviceInfo(
-            identifiers={
-                (DOMAIN, self._node.mac),
-            },
-            name=self._node.native.model,
-            model=self._node.native.model,
-            manufacturer=MANUFACTURER,
-            sw_version=self._node.native.fw,
-        )
-        if self._router.mac != self._node.mac:
-            device_info = DeviceInfo(
-                identifiers={
-                    (DOMAIN, self._node.mac),
-                },
-                name=self._node.native.model,
-                model=self._node.native.model,
-                manufacturer=MANUFACTURER,
-                sw_version=self._node.native.fw,
-                via_device=(DOMAIN, self._router.mac),
-            )
-
-        return device_info
+        return self._node.device_info(self._router.mac)
 
     @callback
     def async_on_demand_update(self) -> None:
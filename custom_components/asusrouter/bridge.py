@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+import copy
 import dataclasses
+from functools import partial
 import logging
+import time
 from typing import Any
 
 import aiohttp
 from asusrouter import AsusRouter
 from asusrouter.config import ARConfig, ARConfigKey as ARConfKey
 from asusrouter.const import DEFAULT_PORT_HTTP, DEFAULT_PORT_HTTPS
-from asusrouter.error import AsusRouterError
+from asusrouter.error import (
+    AsusRouterConnectionError,
+    AsusRouterError,
+    AsusRouterTimeoutError,
+)
 from asusrouter.modules.aimesh import AiMeshDevice
 from asusrouter.modules.client import AsusClient
 from asusrouter.modules.data import AsusData
@@ -40,11 +49,22 @@ from . import helpers
 from .const import (
     AURA,
     BOOTTIME,
+    BREAKER_DELAY,
+    BREAKER_MAX_DELAY,
+    BREAKER_THRESHOLD,
     CONF_CACHE_TIME,
+    CONF_CACHE_TIMES,
     CONF_DEFAULT_CACHE_TIME,
+    CONF_DEFAULT_CACHE_TIMES,
+    CONF_DEFAULT_MAX_REQUESTS,
+    CONF_DEFAULT_MAX_STALE,
     CONF_DEFAULT_MODE,
     CONF_DEFAULT_PORT,
+    CONF_DEFAULT_STALE_DATA,
+    CONF_MAX_REQUESTS,
+    CONF_MAX_STALE,
     CONF_MODE,
+    CONF_STALE_DATA,
     CPU,
     DDNS,
     DEFAULT_SENSORS,
@@ -80,6 +100,11 @@ from .modules.firmware import to_ha as firmware_to_ha
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener of the data revalidated in the background for the current caller
+_revalidated_listener: ContextVar[Callable[[dict[str, Any]], None] | None] = (
+    ContextVar("revalidated_listener", default=None)
+)
+
 
 class ARBridge:
     """Bridge to the AsusRouter library."""
@@ -144,6 +169,60 @@ class ARBridge:
         self._serial_number: str | None = None
         self._sw_version: str | None = None
 
+        # Limit the number of simultaneous requests to the device,
+        # so that a weak router CPU is not flooded
+        self._requests_limit = asyncio.Semaphore(
+            max(
+                1,
+                self._configs.get(
+                    CONF_MAX_REQUESTS, CONF_DEFAULT_MAX_REQUESTS
+                ),
+            )
+        )
+
+        # Freshness window of the slow-changing data. Other datatypes
+        # rely on the API cache with the global `cache_time`
+        self._cache_times: dict[AsusData, float] = {
+            datatype: self._configs.get(key, CONF_DEFAULT_CACHE_TIMES[key])
+            for datatype, key in CONF_CACHE_TIMES.items()
+        }
+        self._cache: dict[AsusData, tuple[float, Any]] = {}
+
+        # Requests currently in progress, shared between the callers
+        self._in_flight: dict[AsusData, tuple[asyncio.Task, bool]] = {}
+
+        # Stale-while-revalidate: serve the latest processed data
+        # while it is younger than `max_stale` and refresh it in the
+        # background
+        self._stale_data: bool = self._configs.get(
+            CONF_STALE_DATA, CONF_DEFAULT_STALE_DATA
+        )
+        self._max_stale: float = self._configs.get(
+            CONF_MAX_STALE, CONF_DEFAULT_MAX_STALE
+        )
+        self._payload_time: dict[tuple[AsusData, Callable | None], float] = {}
+        self._revalidating: dict[
+            tuple[AsusData, Callable | None], asyncio.Task
+        ] = {}
+
+        # Circuit breaker shared by all the requests. After several
+        # connection failures, the requests are stopped and only a single
+        # probe request is made once the backoff delay has passed
+        self._failures: int = 0
+        self._unreachable_until: float = 0.0
+        self._probing: bool = False
+
+        # Time spent on the sensors discovery for each group
+        self._discovery_time: dict[str, float] = {}
+
+        # The latest raw payload and its processed data for each datatype
+        self._payloads: dict[
+            tuple[AsusData, Callable | None], tuple[Any, dict[str, Any]]
+        ] = {}
+
+        # Learned layouts of the data to be flattened
+        self._layouts: dict[AsusData, helpers.FlatLayout] = {}
+
     @staticmethod
     def _get_api(
         configs: dict[str, Any],
@@ -191,6 +270,29 @@ class ARBridge:
 
         return self._api.connected
 
+    @property
+    def cache_key(self) -> list[str] | None:
+        """Return the key for the cached device-specific data.
+
+        The available sensors only change when the model
+        or the firmware of the device changes.
+        """
+
+        if self._identity is None:
+            return None
+
+        return [
+            str(self._identity.model),
+            str(self._identity.product_id),
+            str(self._identity.firmware),
+        ]
+
+    @property
+    def discovery_time(self) -> dict[str, float]:
+        """Return time spent on the sensors discovery for each group."""
+
+        return self._discovery_time
+
     @property
     def identifiers(self) -> set[tuple[str, str]]:
         """Return device identifiers."""
@@ -273,6 +375,9 @@ class ARBridge:
 
         _LOGGER.debug("Disconnecting from the API")
 
+        for task in self._revalidating.values():
+            task.cancel()
+
         await self.api.async_disconnect()
 
     async def async_clean(self) -> None:
@@ -300,126 +405,372 @@ class ARBridge:
             if group in available
         }
 
-    async def async_get_available_sensors(self) -> dict[str, dict[str, Any]]:
-        """Get available sensors."""
+    async def async_get_available_sensors(
+        self,
+        discovered: dict[str, list[str]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get available sensors.
+
+        If the sensors were already discovered (e.g. loaded from the cache),
+        no requests to the device are made.
+        """
+
+        # Sensors which do not depend on the device
+        sensors_static = {
+            BOOTTIME: SENSORS_BOOTTIME,
+            FIRMWARE: SENSORS_FIRMWARE,
+            LED: SENSORS_LED,
+            PARENTAL_CONTROL: SENSORS_PARENTAL_CONTROL,
+            PORT_FORWARDING: SENSORS_PORT_FORWARDING,
+            RAM: SENSORS_RAM,
+        }
+        sensors_discovered = (
+            discovered
+            if discovered is not None
+            else await self.async_discover_sensors()
+        )
 
         sensors = {
-            AURA: {
-                SENSORS: await self._get_sensors_modern(AsusData.AURA),
-                METHOD: self._get_data_aura,
-            },
-            BOOTTIME: {
-                SENSORS: SENSORS_BOOTTIME,
-                METHOD: self._get_data_boottime,
-            },
-            CPU: {
-                SENSORS: await self._get_sensors_modern(AsusData.CPU),
-                METHOD: self._get_data_cpu,
-            },
-            DDNS: {
-                SENSORS: await self._get_sensors_modern(AsusData.DDNS),
-                METHOD: self._get_data_ddns,
-            },
-            DSL: {
-                SENSORS: await self._get_sensors_modern(AsusData.DSL),
-                METHOD: self._get_data_dsl,
-            },
-            FIRMWARE: {
-                SENSORS: SENSORS_FIRMWARE,
-                METHOD: self._get_data_firmware,
-            },
-            GWLAN: {
-                SENSORS: await self._get_sensors_modern(AsusData.GWLAN),
-                METHOD: self._get_data_gwlan,
-            },
-            LED: {
-                SENSORS: SENSORS_LED,
-                METHOD: self._get_data_led,
-            },
-            NETWORK: {
-                SENSORS: await self._get_sensors_modern(AsusData.NETWORK),
-                METHOD: self._get_data_network,
-            },
-            "ovpn_client": {
-                SENSORS: await self._get_sensors_modern(
-                    AsusData.OPENVPN_CLIENT
-                ),
-                METHOD: self._get_data_ovpn_client,
-            },
-            "ovpn_server": {
-                SENSORS: await self._get_sensors_ovpn_server(),
-                METHOD: self._get_data_ovpn_server,
-            },
-            PARENTAL_CONTROL: {
-                SENSORS: SENSORS_PARENTAL_CONTROL,
-                METHOD: self._get_data_parental_control,
-            },
-            PORT_FORWARDING: {
-                SENSORS: SENSORS_PORT_FORWARDING,
-                METHOD: self._get_data_port_forwarding,
-            },
-            PORTS: {
-                SENSORS: await self._get_sensors_ports(),
-                METHOD: self._get_data_ports,
-            },
-            RAM: {SENSORS: SENSORS_RAM, METHOD: self._get_data_ram},
-            "speedtest": {
-                SENSORS: await self._get_sensors_modern(AsusData.SPEEDTEST),
-                METHOD: self._get_data_speedtest,
-            },
-            SYSINFO: {
-                SENSORS: await self._get_sensors_modern(AsusData.SYSINFO),
-                METHOD: self._get_data_sysinfo,
-            },
-            TEMPERATURE: {
-                SENSORS: await self._get_sensors_modern(AsusData.TEMPERATURE),
-                METHOD: self._get_data_temperature,
-            },
-            "wan": {
-                SENSORS: await self._get_sensors_modern(AsusData.WAN),
-                METHOD: self._get_data_wan,
-            },
-            "wireguard_client": {
-                SENSORS: await self._get_sensors_modern(
-                    AsusData.WIREGUARD_CLIENT
-                ),
-                METHOD: self._get_data_wireguard_client,
-            },
-            "wireguard_server": {
-                SENSORS: await self._get_sensors_modern(
-                    AsusData.WIREGUARD_SERVER
-                ),
-                METHOD: self._get_data_wireguard_server,
-            },
-            WLAN: {
-                SENSORS: await self._get_sensors_modern(AsusData.WLAN),
-                METHOD: self._get_data_wlan,
-            },
+            group: {
+                SENSORS: sensors_static.get(group)
+                or sensors_discovered.get(group, []),
+                METHOD: method,
+            }
+            for group, method in self._get_data_methods().items()
         }
 
         # Cleanup sensors if needed
         return await self.async_cleanup_sensors(sensors)
 
+    async def async_discover_sensors(
+        self, strict: bool = False
+    ) -> dict[str, list[str]]:
+        """Discover sensors available on the device.
+
+        All the groups are requested at the same time, while the number
+        of simultaneous requests to the device is limited by the bridge.
+        A group which cannot be discovered gets its default sensors,
+        unless `strict` is set. Then the error is raised instead.
+        """
+
+        modern = partial(self._get_sensors_modern, strict=strict)
+        discovery: dict[str, Callable[[], Awaitable[list[str]]]] = {
+            AURA: partial(modern, AsusData.AURA),
+            CPU: partial(modern, AsusData.CPU),
+            DDNS: partial(modern, AsusData.DDNS),
+            DSL: partial(modern, AsusData.DSL),
+            GWLAN: partial(modern, AsusData.GWLAN),
+            NETWORK: partial(modern, AsusData.NETWORK),
+            "ovpn_client": partial(modern, AsusData.OPENVPN_CLIENT),
+            "ovpn_server": partial(
+                self._get_sensors_ovpn_server, strict=strict
+            ),
+            PORTS: partial(self._get_sensors_ports, strict=strict),
+            "speedtest": partial(modern, AsusData.SPEEDTEST),
+            SYSINFO: partial(modern, AsusData.SYSINFO),
+            TEMPERATURE: partial(modern, AsusData.TEMPERATURE),
+            "wan": partial(modern, AsusData.WAN),
+            "wireguard_client": partial(modern, AsusData.WIREGUARD_CLIENT),
+            "wireguard_server": partial(modern, AsusData.WIREGUARD_SERVER),
+            WLAN: partial(modern, AsusData.WLAN),
+        }
+
+        results = await asyncio.gather(
+            *(
+                self._async_discover_group(group, method)
+                for group, method in discovery.items()
+            )
+        )
+
+        return dict(zip(discovery, results, strict=True))
+
+    async def _async_discover_group(
+        self,
+        group: str,
+        method: Callable[[], Awaitable[list[str]]],
+    ) -> list[str]:
+        """Discover sensors of a single group and measure the time."""
+
+        start = time.monotonic()
+        sensors = await method()
+        self._discovery_time[group] = round(time.monotonic() - start, 3)
+
+        _LOGGER.debug(
+            "Discovery of `%s` sensors took %s s",
+            group,
+            self._discovery_time[group],
+        )
+
+        return sensors
+
+    def _get_data_methods(
+        self,
+    ) -> dict[str, Callable[[], Awaitable[dict[str, Any]]]]:
+        """Get the data methods for each sensors group."""
+
+        return {
+            AURA: self._get_data_aura,
+            BOOTTIME: self._get_data_boottime,
+            CPU: self._get_data_cpu,
+            DDNS: self._get_data_ddns,
+            DSL: self._get_data_dsl,
+            FIRMWARE: self._get_data_firmware,
+            GWLAN: self._get_data_gwlan,
+            LED: self._get_data_led,
+            NETWORK: self._get_data_network,
+            "ovpn_client": self._get_data_ovpn_client,
+            "ovpn_server": self._get_data_ovpn_server,
+            PARENTAL_CONTROL: self._get_data_parental_control,
+            PORT_FORWARDING: self._get_data_port_forwarding,
+            PORTS: self._get_data_ports,
+            RAM: self._get_data_ram,
+            "speedtest": self._get_data_speedtest,
+            SYSINFO: self._get_data_sysinfo,
+            TEMPERATURE: self._get_data_temperature,
+            "wan": self._get_data_wan,
+            "wireguard_client": self._get_data_wireguard_client,
+            "wireguard_server": self._get_data_wireguard_server,
+            WLAN: self._get_data_wlan,
+        }
+
     # GET DATA FROM DEVICE ->
+    # Raw data
+    async def _async_get_raw(
+        self,
+        datatype: AsusData,
+        force: bool = False,
+    ) -> Any:
+        """Get raw data from the device.
+
+        Slow-changing data is served from the cache while it is fresh.
+        Concurrent callers for the same datatype share a single request.
+        A forced request never joins a non-forced one, since it should
+        not be served from the API cache.
+        """
+
+        if not force and datatype in self._cache:
+            timestamp, raw = self._cache[datatype]
+            if time.monotonic() - timestamp < self._cache_times[datatype]:
+                return raw
+
+        in_flight = self._in_flight.get(datatype)
+        if in_flight is not None and (in_flight[1] or not force):
+            return await asyncio.shield(in_flight[0])
+
+        task = asyncio.create_task(self._async_request(datatype, force))
+        self._in_flight[datatype] = (task, force)
+        task.add_done_callback(partial(self._request_done, datatype))
+        return await asyncio.shield(task)
+
+    def _request_done(self, datatype: AsusData, task: asyncio.Task) -> None:
+        """Forget the finished request."""
+
+        in_flight = self._in_flight.get(datatype)
+        if in_flight is not None and in_flight[0] is task:
+            self._in_flight.pop(datatype)
+
+        # Mark the exception as retrieved in case all the callers
+        # have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_request(
+        self,
+        datatype: AsusData,
+        force: bool = False,
+    ) -> Any:
+        """Request data from the API.
+
+        This is the only place where the data is requested from the API,
+        so the number of simultaneous requests can be limited here.
+        """
+
+        probe = self._check_breaker(datatype)
+
+        try:
+            async with self._requests_limit:
+                raw = await self.api.async_get_data(datatype, force=force)
+        except (
+            AsusRouterConnectionError,
+            AsusRouterTimeoutError,
+            OSError,
+            TimeoutError,
+        ):
+            self._breaker_failure()
+            raise
+        finally:
+            if probe:
+                self._probing = False
+
+        self._breaker_success()
+
+        if datatype in self._cache_times:
+            self._cache[datatype] = (time.monotonic(), raw)
+
+        return raw
+
+    def _check_breaker(self, datatype: AsusData) -> bool:
+        """Check whether a request can be made.
+
+        Returns True when the request is the probe of an unreachable
+        device. Raises AsusRouterConnectionError when the request
+        should not be made.
+        """
+
+        if self._failures < BREAKER_THRESHOLD:
+            return False
+
+        if self._probing or time.monotonic() < self._unreachable_until:
+            raise AsusRouterConnectionError(
+                message=f"Device is unreachable, skipping `{datatype}` request"
+            )
+
+        _LOGGER.debug("Probing the unreachable device with `%s`", datatype)
+        self._probing = True
+        return True
+
+    def _breaker_failure(self) -> None:
+        """Register a connection failure."""
+
+        self._failures += 1
+        if self._failures < BREAKER_THRESHOLD:
+            return
+
+        delay = min(
+            BREAKER_DELAY * 2 ** (self._failures - BREAKER_THRESHOLD),
+            BREAKER_MAX_DELAY,
+        )
+        self._unreachable_until = time.monotonic() + delay
+
+        if self._failures == BREAKER_THRESHOLD:
+            _LOGGER.warning(
+                "Device %s is unreachable. Requests are paused", self._host
+            )
+        _LOGGER.debug("Next request to %s in %s s", self._host, delay)
+
+    def _breaker_success(self) -> None:
+        """Register a successful request."""
+
+        if self._failures >= BREAKER_THRESHOLD:
+            _LOGGER.info("Device %s is reachable again", self._host)
+        self._failures = 0
+
     # General method
+    async def async_get_data(
+        self,
+        method: Callable[[], Awaitable[dict[str, Any]]],
+        listener: Callable[[dict[str, Any]], None],
+    ) -> dict[str, Any]:
+        """Get data with the data method of a sensors group.
+
+        When stale data is served, the `listener` gets the fresh data
+        as soon as the background revalidation brings any changes.
+        """
+
+        token = _revalidated_listener.set(listener)
+        try:
+            return await method()
+        finally:
+            _revalidated_listener.reset(token)
+
     async def _get_data(
         self,
         datatype: AsusData,
         process: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
         force: bool = False,
     ) -> dict[str, Any]:
-        """Get data from the device. This is a generic method."""
+        """Get data from the device. This is a generic method.
+
+        Stale data is only served to the callers with a listener for
+        the revalidated data.
+        """
+
+        if (
+            not force
+            and self._stale_data
+            and _revalidated_listener.get() is not None
+        ):
+            stale = self._get_stale_data(datatype, process)
+            if stale is not None:
+                return stale
+
+        return await self._async_fetch_data(datatype, process, force)
+
+    async def _async_fetch_data(
+        self,
+        datatype: AsusData,
+        process: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+        force: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch and process data from the device."""
 
         try:
-            raw = await self.api.async_get_data(datatype, force=force)
+            raw = await self._async_get_raw(datatype, force=force)
             if raw is None:
                 raw = {}
-            if process is not None:
-                return process(raw)
-            return self._process_data(raw)
+            return self._process_payload(datatype, raw, process)
         except AsusRouterError as ex:
             raise UpdateFailed(ex) from ex
 
+    def _get_stale_data(
+        self,
+        datatype: AsusData,
+        process: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the latest processed data and revalidate it.
+
+        Returns None when there is no data younger than `max_stale`.
+        """
+
+        key = (datatype, process)
+        previous = self._payloads.get(key)
+        timestamp = self._payload_time.get(key)
+        if (
+            previous is None
+            or timestamp is None
+            or time.monotonic() - timestamp > self._max_stale
+        ):
+            return None
+
+        if key not in self._revalidating:
+            task = self.hass.async_create_background_task(
+                self._async_fetch_data(datatype, process),
+                name=f"{DOMAIN}_revalidate_{datatype.value}",
+            )
+            self._revalidating[key] = task
+            task.add_done_callback(
+                partial(
+                    self._revalidate_done,
+                    key,
+                    previous[1],
+                    _revalidated_listener.get(),
+                )
+            )
+
+        return previous[1]
+
+    def _revalidate_done(
+        self,
+        key: tuple[AsusData, Callable | None],
+        stale: dict[str, Any],
+        listener: Callable[[dict[str, Any]], None] | None,
+        task: asyncio.Task,
+    ) -> None:
+        """Forget the finished revalidation and pass on the new data."""
+
+        self._revalidating.pop(key, None)
+
+        if task.cancelled():
+            return
+        if (ex := task.exception()) is not None:
+            _LOGGER.debug("Cannot revalidate `%s` data: %s", key[0], ex)
+            return
+
+        # The same payload is processed into the same object
+        data = task.result()
+        if listener is not None and data is not stale:
+            listener(data)
+
     async def _get_data_modern(
         self,
         datatype: AsusData,
@@ -427,11 +778,53 @@ class ARBridge:
     ) -> dict[str, Any]:
         """Get data from the device. This is a generic method."""
 
-        try:
-            raw = await self.api.async_get_data(datatype, force=force)
-            return self._process_data_modern(raw)
-        except AsusRouterError as ex:
-            raise UpdateFailed(ex) from ex
+        return await self._get_data(
+            datatype, self._process_data_modern, force=force
+        )
+
+    def _process_payload(
+        self,
+        datatype: AsusData,
+        raw: Any,
+        process: Callable[[Any], dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Process the raw payload unless it has not changed.
+
+        For the same payload as before, the previously processed data
+        is returned as is. Coordinators do not notify their entities
+        when the data is the same, so nothing has to be written.
+        A copy of the payload is kept, since the library can update
+        its cached data in place.
+        """
+
+        key = (datatype, process)
+        previous = self._payloads.get(key)
+        if previous is not None and previous[0] == raw:
+            self._payload_time[key] = time.monotonic()
+            return previous[1]
+
+        processed = (
+            process(raw)
+            if process is not None
+            else self._flatten_data(datatype, raw)
+        )
+        self._payloads[key] = (copy.deepcopy(raw), processed)
+        self._payload_time[key] = time.monotonic()
+        return processed
+
+    def _flatten_data(self, datatype: AsusData, raw: Any) -> dict[str, Any]:
+        """Flatten data using the learned layout of the datatype."""
+
+        layout = self._layouts.get(datatype)
+        if layout is not None:
+            flat = layout.flatten(raw)
+            if flat is not None:
+                return flat
+
+        # Learn the new layout
+        _LOGGER.debug("Learning the data layout of `%s`", datatype)
+        self._layouts[datatype] = helpers.FlatLayout(raw)
+        return self._process_data(raw)
 
     # AiMesh nodes
     async def async_get_aimesh_nodes(self) -> dict[str, AiMeshDevice]:
@@ -449,9 +842,7 @@ class ARBridge:
     async def _get_data_aura(self) -> dict[str, Any]:
         """Get Aura data from the device."""
 
-        data = await self._get_data_modern(AsusData.AURA)
-
-        return aura_to_ha(data)
+        return await self._get_data(AsusData.AURA, self._process_data_aura)
 
     async def _get_data_boottime(self) -> dict[str, Any]:
         """Get `boottime` data from the device."""
@@ -476,9 +867,9 @@ class ARBridge:
     async def _get_data_firmware(self) -> dict[str, Any]:
         """Get firmware data from the device."""
 
-        data = await self._get_data_modern(AsusData.FIRMWARE)
-
-        return firmware_to_ha(data)
+        return await self._get_data(
+            AsusData.FIRMWARE, self._process_data_firmware
+        )
 
     async def _get_data_gwlan(self) -> dict[str, Any]:
         """Get GWLAN data from the device."""
@@ -581,6 +972,18 @@ class ARBridge:
 
         return helpers.clean_dict(convert_to_ha_data(raw))
 
+    @staticmethod
+    def _process_data_aura(raw: dict[str, Any]) -> dict[str, Any]:
+        """Process `aura` data."""
+
+        return aura_to_ha(ARBridge._process_data_modern(raw))
+
+    @staticmethod
+    def _process_data_firmware(raw: dict[str, Any]) -> dict[str, Any]:
+        """Process `firmware` data."""
+
+        return firmware_to_ha(ARBridge._process_data_modern(raw))
+
     @staticmethod
     def _process_data_parental_control(raw: dict[str, Any]) -> dict[str, Any]:
         """Process `parental control` data."""
@@ -648,12 +1051,16 @@ class ARBridge:
         process: Callable[[dict[str, Any]], list[str]] | None = None,
         sensor_type: str | None = None,
         defaults: bool = False,
+        strict: bool = False,
     ) -> list[str]:
-        """Get the available sensors. This is a generic method."""
+        """Get the available sensors. This is a generic method.
+
+        Errors are only raised when `strict` is set.
+        """
 
         sensors = []
         try:
-            data = await self.api.async_get_data(datatype)
+            data = await self._async_get_raw(datatype)
             _LOGGER.debug(
                 "Raw `%s` sensors of type (%s): %s", datatype, type(data), data
             )
@@ -664,6 +1071,8 @@ class ARBridge:
             )
             _LOGGER.debug("Available `%s` sensors: %s", sensor_type, sensors)
         except AsusRouterError as ex:
+            if strict:
+                raise
             if sensor_type in DEFAULT_SENSORS and defaults:
                 sensors = DEFAULT_SENSORS[sensor_type]
             _LOGGER.debug(
@@ -674,12 +1083,17 @@ class ARBridge:
             )
         return sensors
 
-    async def _get_sensors_modern(self, datatype: AsusData) -> list[str]:
-        """Get the available sensors. This is a generic method."""
+    async def _get_sensors_modern(
+        self, datatype: AsusData, strict: bool = False
+    ) -> list[str]:
+        """Get the available sensors. This is a generic method.
+
+        Errors are only raised when `strict` is set.
+        """
 
         sensors = []
         try:
-            data = await self.api.async_get_data(datatype)
+            data = await self._async_get_raw(datatype)
             _LOGGER.debug(
                 "Raw `%s` sensors of type (%s): %s", datatype, type(data), data
             )
@@ -688,6 +1102,8 @@ class ARBridge:
                 "Available `%s` sensors: %s", datatype.value, sensors
             )
         except AsusRouterError as ex:
+            if strict:
+                raise
             if datatype.value in DEFAULT_SENSORS:
                 sensors = DEFAULT_SENSORS[datatype.value]
             _LOGGER.debug(
@@ -698,22 +1114,26 @@ class ARBridge:
             )
         return sensors
 
-    async def _get_sensors_ovpn_server(self) -> list[str]:
+    async def _get_sensors_ovpn_server(
+        self, strict: bool = False
+    ) -> list[str]:
         """Get the available OpenVPN server sensors."""
 
         return await self._get_sensors(
             AsusData.OPENVPN_SERVER,
             self._process_sensors_ovpn_server,
             sensor_type="ovpn_server",
+            strict=strict,
         )
 
-    async def _get_sensors_ports(self) -> list[str]:
+    async def _get_sensors_ports(self, strict: bool = False) -> list[str]:
         """Get the available ports sensors."""
 
         return await self._get_sensors(
             AsusData.PORTS,
             self._process_sensors_ports,
             sensor_type=PORTS,
+            strict=strict,
         )
 
     # <- GET SENSORS LIST
@@ -820,7 +1240,7 @@ class ARBridge:
 
         # Set the rules
         for rule in rules_to_set:
-            result = await self.api.async_set_state(rule)
+            result = await self.async_set_state(rule)
             if result is True:
                 _LOGGER.debug("Parental control rule set: %s", rule)
             else:
@@ -828,6 +1248,22 @@ class ARBridge:
 
         return True
 
+    async def async_set_state(self, state: Any, **kwargs: Any) -> bool:
+        """Set the state of the device.
+
+        Cached data and requests started before the change are dropped,
+        so that the following refresh gets the new data.
+        """
+
+        self._cache.clear()
+        self._in_flight.clear()
+        for task in self._revalidating.values():
+            task.cancel()
+        result = await self.api.async_set_state(state=state, **kwargs)
+        self._payloads.clear()
+        self._payload_time.clear()
+        return result
+
     # --------------------
     # <-- Services
     # --------------------
@@ -99,7 +99,7 @@ class ARButton(ButtonEntity):
 
         try:
             _LOGGER.debug("Pressing %s", state)
-            result = await self.api.async_set_state(
+            result = await self.router.bridge.async_set_state(
                 state=state, expect_modify=expect_modify, **kwargs
             )
             if not result:
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import UTC, datetime
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import IntEnum
+import heapq
+import logging
+import math
+import re
 from typing import Any
 
 from asusrouter.modules.client import (
@@ -17,11 +24,601 @@ from asusrouter.modules.homeassistant import convert_to_ha_state_bool
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 
-from .helpers import clean_dict
+_LOGGER = logging.getLogger(__name__)
+
+MAC_OCTETS = 6
+MAC_OCTET = re.compile(r"[0-9a-f]{1,2}")
+MAC_WILDCARD = "*"
+
+# Last activity of the clients never seen connected
+NEVER_SEEN = datetime.min.replace(tzinfo=UTC)
+
+# Rate limit key of the connection events
+CONNECTION_STATE = "connection_state"
+
+
+@dataclass
+class ARClientsDiff:
+    """Difference between two updates of the clients."""
+
+    # New clients
+    added: set[str] = field(default_factory=set)
+    # Clients which are not reported by the device anymore
+    removed: set[str] = field(default_factory=set)
+    # Clients with a changed identity or connection state
+    changed: set[str] = field(default_factory=set)
+    # Clients with changed extra attributes only
+    updated: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return True if anything has changed."""
+
+        return bool(self.added or self.removed or self.changed or self.updated)
+
+
+class ARClientFilter:
+    """Clients filter compiled for constant-time matching.
+
+    Besides the exact MAC addresses, the filter supports rules with
+    wildcard octets, e.g. `00:11:22:*` for all the devices of a vendor
+    (OUI) or `00:*:22:33:44:55`. Rules are grouped by the positions of
+    the wildcards, so matching needs one set lookup per group.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        macs: Iterable[str] = (),
+        rules: Iterable[str] = (),
+    ) -> None:
+        """Initialize the clients filter."""
+
+        self._mode = mode
+        self._macs = frozenset(format_mac(mac) for mac in macs)
+
+        groups: dict[tuple[int, ...], set[tuple[str, ...]]] = {}
+        for rule in rules:
+            if not rule.strip():
+                continue
+            octets = _split_rule(rule)
+            if octets is None:
+                _LOGGER.warning("Invalid clients filter rule: `%s`", rule)
+                continue
+            mask = tuple(
+                index
+                for index, octet in enumerate(octets)
+                if octet != MAC_WILDCARD
+            )
+            groups.setdefault(mask, set()).add(
+                tuple(octets[index] for index in mask)
+            )
+        self._rules = {mask: frozenset(keys) for mask, keys in groups.items()}
+
+    def match(self, mac: str) -> bool:
+        """Check whether the MAC address is in the filter."""
+
+        if mac in self._macs:
+            return True
+
+        if not self._rules:
+            return False
+
+        octets = mac.split(":")
+        return any(
+            tuple(octets[index] for index in mask) in keys
+            for mask, keys in self._rules.items()
+        )
+
+    def allows(self, mac: str) -> bool:
+        """Check whether the client passes the filter."""
+
+        match self._mode:
+            case "include":
+                return self.match(mac)
+            case "exclude":
+                return not self.match(mac)
+        return True
+
+    @property
+    def mode(self) -> str:
+        """Return the filter mode."""
+
+        return self._mode
+
+
+def _split_rule(rule: str) -> list[str] | None:
+    """Split the filter rule into normalised octets.
+
+    Missing trailing octets are considered wildcards.
+    """
+
+    octets = rule.strip().lower().replace("-", ":").split(":")
+    if len(octets) > MAC_OCTETS:
+        return None
+
+    octets.extend([MAC_WILDCARD] * (MAC_OCTETS - len(octets)))
+    for index, octet in enumerate(octets):
+        if octet == MAC_WILDCARD:
+            continue
+        if MAC_OCTET.fullmatch(octet) is None:
+            return None
+        octets[index] = octet.zfill(2)
+
+    if all(octet == MAC_WILDCARD for octet in octets):
+        return None
+
+    return octets
+
+
+class ARClientsExpiry:
+    """Expiry of the connected clients grouped in 1-second buckets.
+
+    Each client is kept in the bucket of its expiry time, so only the
+    expired buckets have to be checked when the time comes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the clients expiry."""
+
+        self._buckets: dict[int, set[str]] = {}
+        self._bucket: dict[str, int] = {}
+        # Bucket keys, may contain the already removed ones
+        self._heap: list[int] = []
+
+    def schedule(self, mac: str, when: datetime) -> None:
+        """Schedule the expiry of the client."""
+
+        bucket = math.ceil(when.timestamp())
+        current = self._bucket.get(mac)
+        if current == bucket:
+            return
+
+        if current is not None:
+            self._discard(mac, current)
+
+        self._bucket[mac] = bucket
+        if bucket not in self._buckets:
+            self._buckets[bucket] = set()
+            heapq.heappush(self._heap, bucket)
+        self._buckets[bucket].add(mac)
+
+    def cancel(self, mac: str) -> None:
+        """Cancel the expiry of the client."""
+
+        current = self._bucket.pop(mac, None)
+        if current is not None:
+            self._discard(mac, current)
+
+    def _discard(self, mac: str, bucket: int) -> None:
+        """Remove the client from the bucket."""
+
+        macs = self._buckets[bucket]
+        macs.discard(mac)
+        if not macs:
+            del self._buckets[bucket]
+
+    def pop_expired(self, now: datetime) -> set[str]:
+        """Remove and return the clients expired by `now`."""
+
+        timestamp = now.timestamp()
+        expired: set[str] = set()
+        while self._heap and self._heap[0] <= timestamp:
+            macs = self._buckets.pop(heapq.heappop(self._heap), None)
+            if macs is None:
+                continue
+            for mac in macs:
+                del self._bucket[mac]
+            expired |= macs
+        return expired
+
+    @property
+    def next_expiry(self) -> datetime | None:
+        """Return the time of the next expiry."""
+
+        while self._heap and self._heap[0] not in self._buckets:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return datetime.fromtimestamp(self._heap[0], UTC)
+
+
+class ARLatestClients:
+    """Latest connected clients.
+
+    Keeps at most `capacity` clients with the newest connection time.
+    The oldest client is found with a heap, so an update costs
+    O(log capacity).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the latest connected clients."""
+
+        self._capacity = capacity
+        self._clients: dict[str, tuple[datetime, dict[str, Any]]] = {}
+        # May contain outdated entries, which are skipped when found
+        self._heap: list[tuple[datetime, str]] = []
+
+    def update(self, identity: dict[str, Any]) -> bool:
+        """Update with the client identity.
+
+        Returns True if the latest connected clients have changed.
+        """
+
+        connected = identity.get("connected")
+        if not isinstance(connected, datetime) or self._capacity < 1:
+            return False
+
+        mac = identity["mac"]
+        current = self._clients.get(mac)
+
+        # Known client
+        if current is not None:
+            if current[1] is identity:
+                return False
+            self._clients[mac] = (connected, identity)
+            if current[0] != connected:
+                self._push(connected, mac)
+            return True
+
+        # New client replaces the oldest one
+        if len(self._clients) >= self._capacity:
+            oldest, oldest_mac = self._oldest()
+            if connected <= oldest:
+                return False
+            heapq.heappop(self._heap)
+            del self._clients[oldest_mac]
+
+        self._clients[mac] = (connected, identity)
+        self._push(connected, mac)
+        return True
+
+    def remove(self, mac: str) -> bool:
+        """Remove the client.
+
+        Returns True if the client was one of the latest connected.
+        Its heap entry is outdated from now on.
+        """
+
+        return self._clients.pop(mac, None) is not None
+
+    def _push(self, connected: datetime, mac: str) -> None:
+        """Add the client to the heap."""
+
+        heapq.heappush(self._heap, (connected, mac))
+
+        # Drop the outdated entries
+        if len(self._heap) > 2 * self._capacity:
+            self._heap = [
+                (since, client) for client, (since, _) in self._clients.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _oldest(self) -> tuple[datetime, str]:
+        """Get the oldest client."""
+
+        while True:
+            connected, mac = self._heap[0]
+            current = self._clients.get(mac)
+            if current is not None and current[0] == connected:
+                return connected, mac
+            heapq.heappop(self._heap)
+
+    @property
+    def clients(self) -> list[dict[str, Any]]:
+        """Return the clients, the newest client last."""
+
+        return [
+            identity
+            for _, identity in sorted(
+                self._clients.values(), key=lambda item: item[0]
+            )
+        ]
+
+
+class ARClientsEvents:
+    """Client events collected during an update.
+
+    The connected and disconnected clients are reported with a single
+    event per update. Events of a single client are limited to one per
+    `rate_limit` seconds for each event type, so a flapping client
+    cannot flood the event bus. Connections and disconnections share
+    a single limit, and the latest suppressed state is fired once
+    the limit is over, so the events always come in pairs.
+    """
+
+    def __init__(self, rate_limit: float) -> None:
+        """Initialize the client events."""
+
+        self._rate_limit = rate_limit
+        self._added: set[str] = set()
+        self._removed: set[str] = set()
+        # Last time the event was fired for the client and the fired
+        # connection state
+        self._fired: dict[tuple[str, str], tuple[float, bool | None]] = {}
+        # Latest suppressed connection event of the client
+        self._pending: dict[str, tuple[str, bool, dict[str, Any] | None]] = {}
+
+    def connected(self, mac: str) -> None:
+        """Collect the connected client."""
+
+        self._removed.discard(mac)
+        self._added.add(mac)
+
+    def disconnected(self, mac: str) -> None:
+        """Collect the disconnected client."""
+
+        self._added.discard(mac)
+        self._removed.add(mac)
+
+    def allow(
+        self,
+        event: str,
+        mac: str,
+        now: float,
+        state: bool | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> bool:
+        """Check whether the client event can be fired at `now`.
+
+        Events with the connection `state` are limited together.
+        A suppressed state change is kept to be fired by `pop_due`,
+        unless the client gets back to the fired state.
+        """
+
+        key = (event if state is None else CONNECTION_STATE, mac)
+        fired = self._fired.get(key)
+        if fired is not None and now - fired[0] < self._rate_limit:
+            if state is not None:
+                if state == fired[1]:
+                    self._pending.pop(mac, None)
+                else:
+                    self._pending[mac] = (event, state, args)
+            return False
+
+        self._fired[key] = (now, state)
+        if state is not None:
+            self._pending.pop(mac, None)
+        return True
+
+    def pop_due(self, now: float) -> list[tuple[str, dict[str, Any] | None]]:
+        """Return the suppressed connection events which can be fired."""
+
+        events: list[tuple[str, dict[str, Any] | None]] = []
+        for mac, (event, state, args) in list(self._pending.items()):
+            key = (CONNECTION_STATE, mac)
+            if now - self._fired[key][0] < self._rate_limit:
+                continue
+            del self._pending[mac]
+            self._fired[key] = (now, state)
+            events.append((event, args))
+        return events
+
+    def flush(self, now: float) -> dict[str, list[str]] | None:
+        """Return the collected changes and start a new batch.
+
+        Returns None if there were no changes.
+        """
+
+        # Forget the clients which are not limited anymore
+        self._fired = {
+            key: fired
+            for key, fired in self._fired.items()
+            if now - fired[0] < self._rate_limit or key[1] in self._pending
+        }
+
+        if not self._added and not self._removed:
+            return None
+
+        changes = {
+            "added": sorted(self._added),
+            "removed": sorted(self._removed),
+        }
+        self._added.clear()
+        self._removed.clear()
+        return changes
+
+
+@dataclass
+class ARNodeLoad:
+    """Connected clients of an AiMesh node."""
+
+    clients: int = 0
+    # Number of clients for each connection type
+    bands: dict[str, int] = field(default_factory=dict)
+    # Sum of the reported RSSI values and the number of such clients
+    rssi_sum: int = 0
+    rssi_clients: int = 0
+
+    def add(self, band: str, rssi: int | None, count: int = 1) -> None:
+        """Add the client, or remove it with a negative `count`."""
+
+        self.clients += count
+        self.bands[band] = self.bands.get(band, 0) + count
+        if not self.bands[band]:
+            del self.bands[band]
+        if rssi is not None:
+            self.rssi_sum += count * rssi
+            self.rssi_clients += count
+
+    @property
+    def rssi(self) -> float | None:
+        """Return the average RSSI of the clients."""
+
+        if not self.rssi_clients:
+            return None
+        return round(self.rssi_sum / self.rssi_clients, 1)
+
+
+class ARNodesLoad:
+    """Connected clients of each AiMesh node.
+
+    Updated with the changed clients only, so the node values are read
+    without going through all the clients.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the nodes load."""
+
+        # Node, connection type and RSSI of each connected client
+        self._clients: dict[str, tuple[str, str, int | None]] = {}
+        self._nodes: dict[str, ARNodeLoad] = {}
+
+    def update(self, mac: str, client: ARClient | None) -> set[str]:
+        """Update with the client and return the changed nodes."""
+
+        entry = None
+        if client is not None and client.state is True and client.node:
+            entry = (client.node, client.connection_type.value, client.rssi)
+
+        current = self._clients.get(mac)
+        if entry == current:
+            return set()
+
+        changed: set[str] = set()
+        if current is not None:
+            node, band, rssi = current
+            self._nodes[node].add(band, rssi, -1)
+            del self._clients[mac]
+            changed.add(node)
+        if entry is not None:
+            node, band, rssi = entry
+            self._nodes.setdefault(node, ARNodeLoad()).add(band, rssi)
+            self._clients[mac] = entry
+            changed.add(node)
+        return changed
+
+    def get(self, node: str) -> ARNodeLoad:
+        """Return the load of the node."""
+
+        return self._nodes.get(node) or ARNodeLoad()
+
+
+@dataclass(slots=True)
+class ARClientRoam:
+    """Roam of a wireless client."""
+
+    time: datetime
+    from_node: str
+    from_band: str
+    to_node: str
+    to_band: str
+
+
+class ARClientsRoaming:
+    """Roaming of the wireless clients between AiMesh nodes and bands.
+
+    Only the changed clients have to be checked. The latest `history`
+    roams of each client are kept, so the memory per client is fixed.
+    """
+
+    def __init__(self, history: int) -> None:
+        """Initialize the roaming detector."""
+
+        self._history = history
+        # Node and band of each connected wireless client
+        self._location: dict[str, tuple[str, str]] = {}
+        self._roams: dict[str, deque[ARClientRoam]] = {}
+        self._counter: dict[str, int] = {}
+
+    def update(
+        self, mac: str, client: ARClient | None, now: datetime
+    ) -> dict[str, Any] | None:
+        """Update with the client and return the roam event data."""
+
+        if (
+            client is None
+            or client.state is not True
+            or not client.node
+            or client.connection_type
+            in (ConnectionType.WIRED, ConnectionType.DISCONNECTED)
+        ):
+            self._location.pop(mac, None)
+            return None
+
+        location = (client.node, client.connection_type.value)
+        previous = self._location.get(mac)
+        self._location[mac] = location
+        if previous is None or previous == location:
+            return None
+
+        roam = ARClientRoam(now, *previous, *location)
+        if mac not in self._roams:
+            self._roams[mac] = deque(maxlen=self._history)
+        self._roams[mac].append(roam)
+        self._counter[mac] = self._counter.get(mac, 0) + 1
+
+        return {
+            "mac": mac,
+            "from_node": roam.from_node,
+            "from_band": roam.from_band,
+            "to_node": roam.to_node,
+            "to_band": roam.to_band,
+            "roams": self._counter[mac],
+        }
+
+    def remove(self, mac: str) -> None:
+        """Forget the client."""
+
+        self._location.pop(mac, None)
+        self._roams.pop(mac, None)
+        self._counter.pop(mac, None)
+
+    def roams(self, mac: str) -> list[ARClientRoam]:
+        """Return the latest roams of the client, the newest last."""
+
+        return list(self._roams.get(mac, ()))
+
+    @property
+    def total(self) -> int:
+        """Return the number of roams of all the clients."""
+
+        return sum(self._counter.values())
+
+
+class ARClientChange(IntEnum):
+    """Change of the client on update."""
+
+    NONE = 0
+    # Only the extra attributes have changed
+    ATTRIBUTES = 1
+    # The identity or the connection state has changed
+    IDENTITY = 2
 
 
 class ARClient:
-    """AsussRouter Client class."""
+    """AsussRouter Client class.
+
+    Only the values used by the integration are kept from the device
+    data. The identity and the extra attributes are generated when they
+    are requested and cached until the underlying values change.
+    """
+
+    __slots__ = (
+        "_connected_since",
+        "_connection",
+        "_connection_type",
+        "_extra_state_attributes",
+        "_guest",
+        "_guest_id",
+        "_identity",
+        "_internet_mode",
+        "_internet_state",
+        "_ip_address",
+        "_ip_method",
+        "_last_activity",
+        "_mac",
+        "_name",
+        "_new",
+        "_node",
+        "_reported_state",
+        "_rssi",
+        "_rx_speed",
+        "_state",
+        "_tx_speed",
+        "_vendor",
+        "_wlan",
+        "device",
+    )
 
     def __init__(
         self,
@@ -32,25 +629,36 @@ class ARClient:
 
         self._mac = mac
         self._name = name
+        self._new = True
 
         self.device: bool = False
 
         # To be recieved from the device
         # Client description
-        self.description: AsusClientDescription | None = None
-        # Connection description -
-        # AsusClientConnection / AsusClientConnectionWlan
-        self.connection: AsusClientConnection | None = None
+        self._vendor: str | None = None
+        # Connection description
+        self._connection: bool = False
+        self._wlan: bool = False
+        self._ip_address: str | None = None
+        self._ip_method: str | None = None
+        self._internet_mode: Any = None
+        self._internet_state: bool | None = None
+        self._node: str | None = None
+        self._rssi: int | None = None
+        self._rx_speed: float | None = None
+        self._tx_speed: float | None = None
+        self._connected_since: datetime | None = None
 
         # To be generated for other parts of the integration
         self._identity: dict[str, Any] | None = None
-        self._extra_state_attributes: dict[str, Any] = {}
+        self._extra_state_attributes: dict[str, Any] | None = None
 
         # Connection state
         self._state: ConnectionState = ConnectionState.UNKNOWN
+        self._reported_state: ConnectionState | None = None
         self._connection_type: ConnectionType = ConnectionType.DISCONNECTED
-        self._guest: bool = False
-        self._guest_id: int = 0
+        self._guest: bool | None = False
+        self._guest_id: int | None = 0
 
         # Device last active
         self._last_activity: datetime | None = None
@@ -59,33 +667,47 @@ class ARClient:
     def update(
         self,
         client_info: AsusClient | None = None,
-        consider_home: int = 0,
         event_call: Callable[[str, dict[str, Any] | None], None] | None = None,
-    ) -> None:
-        """Update client information."""
+    ) -> ARClientChange:
+        """Update client information.
+
+        Returns the kind of change, so that only the changed clients
+        have to be written. A connected client is only marked as
+        disconnected by `expire`.
+        """
 
         utc_now: datetime = datetime.now(UTC)
 
         state: ConnectionState | None = None
+        previous_state = self._state
+        change = ARClientChange.NONE
 
         # If client information is provided
         if client_info is not None:
-            # Description
-            self.description = client_info.description
-
-            # Connection
-            self.connection = client_info.connection
-
             # Connected state
             state = client_info.state
 
-        self._identity = self.generate_identity(state)
-        self._extra_state_attributes = self.generate_extra_state_attributes()
+            change = self._update_description(client_info.description)
+            change = max(
+                change, self._update_connection(client_info.connection)
+            )
+
+        if state is not self._reported_state or self._new:
+            self._reported_state = state
+            self._new = False
+            change = ARClientChange.IDENTITY
+
+        # Drop the outdated views
+        if change is ARClientChange.IDENTITY:
+            self._identity = None
+        if change is not ARClientChange.NONE:
+            self._extra_state_attributes = None
 
         # If is connected
         if state is ConnectionState.CONNECTED:
             # Update last activity
             self._last_activity = utc_now
+            self._extra_state_attributes = None
 
             # Device was disconnected, now it has reconnected
             # Fire event and connected callback
@@ -98,78 +720,215 @@ class ARClient:
             # Update connection status
             self._state = ConnectionState.CONNECTED
 
-        # If was connected, check if it's time to mark it as disconnected
-        # when we are above the consider home time
-        elif (
-            self._state is ConnectionState.CONNECTED
-            and self._last_activity is not None
-            and (utc_now - self._last_activity).total_seconds() > consider_home
+        if self._state is not previous_state:
+            return ARClientChange.IDENTITY
+        return change
+
+    @callback
+    def expire(
+        self,
+        event_call: Callable[[str, dict[str, Any] | None], None] | None = None,
+    ) -> bool:
+        """Mark the client as disconnected after the consider home time.
+
+        Returns True if the connection state has changed.
+        """
+
+        if self._state is not ConnectionState.CONNECTED:
+            return False
+
+        # Update connection status
+        self._state = ConnectionState.DISCONNECTED
+
+        # Fire event
+        if event_call is not None:
+            event_call(
+                "device_disconnected",
+                self.identity,
+            )
+
+        return True
+
+    def _update_description(
+        self, description: AsusClientDescription | None
+    ) -> ARClientChange:
+        """Update the values from the client description."""
+
+        if description is None:
+            return ARClientChange.NONE
+
+        change = ARClientChange.NONE
+        if description.name != self._name:
+            self._name = description.name
+            change = ARClientChange.IDENTITY
+        if description.vendor != self._vendor:
+            self._vendor = description.vendor
+            change = max(change, ARClientChange.ATTRIBUTES)
+        return change
+
+    def _update_connection(
+        self, connection: AsusClientConnection | None
+    ) -> ARClientChange:
+        """Update the values from the client connection."""
+
+        if connection is None:
+            return ARClientChange.NONE
+
+        change = ARClientChange.NONE
+        wlan = isinstance(connection, AsusClientConnectionWlan)
+        connection_type = (
+            connection.type
+            if connection.type != ConnectionType.DISCONNECTED
+            else self._connection_type
+        )
+        node = format_mac(connection.node) if connection.node else None
+        guest = connection.guest if wlan else self._guest
+        guest_id = connection.guest_id if wlan else self._guest_id
+        since = connection.since if wlan else None
+
+        if (
+            not self._connection
+            or wlan != self._wlan
+            or connection_type != self._connection_type
+            or connection.ip_address != self._ip_address
+            or node != self._node
+            or guest != self._guest
+            or guest_id != self._guest_id
+            or since != self._connected_since
         ):
-            # Update connection status
-            self._state = ConnectionState.DISCONNECTED
+            self._connection = True
+            self._wlan = wlan
+            self._connection_type = connection_type
+            self._ip_address = connection.ip_address
+            self._node = node
+            self._guest = guest
+            self._guest_id = guest_id
+            self._connected_since = since
+            change = ARClientChange.IDENTITY
 
-            # Fire event
-            if event_call is not None:
-                event_call(
-                    "device_disconnected",
-                    self.identity,
-                )
+        rssi = connection.rssi if wlan else None
+        rx_speed = connection.rx_speed if wlan else None
+        tx_speed = connection.tx_speed if wlan else None
+
+        if (
+            connection.ip_method != self._ip_method
+            or connection.internet_mode != self._internet_mode
+            or connection.internet_state != self._internet_state
+            or rssi != self._rssi
+            or rx_speed != self._rx_speed
+            or tx_speed != self._tx_speed
+        ):
+            self._ip_method = connection.ip_method
+            self._internet_mode = connection.internet_mode
+            self._internet_state = connection.internet_state
+            self._rssi = rssi
+            self._rx_speed = rx_speed
+            self._tx_speed = tx_speed
+            change = max(change, ARClientChange.ATTRIBUTES)
+
+        return change
 
     def generate_identity(
         self, state: ConnectionState | None
     ) -> dict[str, Any]:
         """Generate client identity."""
 
-        identity: dict[str, Any] = {
-            "mac": self.mac_address,
-            "ip": self.ip_address,
-            "name": self.name,
-        }
+        identity: dict[str, Any] = {"mac": self.mac_address}
+        _set_value(identity, "ip", self._ip_address)
+        _set_value(identity, "name", self._name)
 
-        if isinstance(self.connection, AsusClientConnection):
+        if self._connection:
             # Rewrite guest from last known state if needed
-            if state == ConnectionState.DISCONNECTED:
-                identity["guest"] = self._guest
-                identity["guest_id"] = self._guest_id
-            if self.connection.type != ConnectionType.DISCONNECTED:
-                self._connection_type = self.connection.type
+            if state == ConnectionState.DISCONNECTED or self._wlan:
+                _set_value(identity, "guest", self._guest)
+                _set_value(identity, "guest_id", self._guest_id)
             identity["connection_type"] = self._connection_type
-            identity["node"] = (
-                format_mac(self.connection.node)
-                if self.connection.node
-                else None
-            )
+            _set_value(identity, "node", self._node)
 
-        if isinstance(self.connection, AsusClientConnectionWlan):
-            identity["guest"] = self._guest = self.connection.guest
-            identity["guest_id"] = self._guest_id = self.connection.guest_id
-            identity["connected"] = self.connection.since
+        if self._wlan:
+            _set_value(identity, "connected", self._connected_since)
 
-        return clean_dict(identity)
+        return identity
 
     def generate_extra_state_attributes(self) -> dict[str, Any]:
         """Generate extra state attributes."""
 
-        attributes: dict[str, Any] = (
-            self._identity.copy() if self._identity else {}
-        )
+        attributes: dict[str, Any] = dict(self.identity)
+
+        _set_value(attributes, "last_activity", self._last_activity)
+        _set_value(attributes, "vendor", self._vendor)
+
+        if self._connection:
+            _set_value(attributes, "ip_type", self._ip_method)
+            _set_value(attributes, "internet_mode", self._internet_mode)
+            _set_value(attributes, "internet", self._internet_state)
+
+        if self._wlan:
+            _set_value(attributes, "rssi", self._rssi)
+            _set_value(attributes, "rx_speed", self._rx_speed)
+            _set_value(attributes, "tx_speed", self._tx_speed)
+
+        return attributes
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the client state to be stored between restarts."""
+
+        snapshot: dict[str, Any] = {"state": self._state.value}
+        _set_value(snapshot, "name", self._name)
+        _set_value(snapshot, "vendor", self._vendor)
+        _set_value(snapshot, "ip", self._ip_address)
+        _set_value(snapshot, "node", self._node)
+        if self._last_activity is not None:
+            snapshot["last_activity"] = self._last_activity.isoformat()
 
-        attributes["last_activity"] = self._last_activity
+        if self._connection:
+            snapshot["connection_type"] = self._connection_type.value
+            snapshot["wlan"] = self._wlan
+            _set_value(snapshot, "guest", self._guest)
+            _set_value(snapshot, "guest_id", self._guest_id)
+            if self._connected_since is not None:
+                snapshot["connected"] = self._connected_since.isoformat()
 
-        if isinstance(self.description, AsusClientDescription):
-            attributes["vendor"] = self.description.vendor
+        return snapshot
 
-        if isinstance(self.connection, AsusClientConnection):
-            attributes["ip_type"] = self.connection.ip_method
-            attributes["internet_mode"] = self.connection.internet_mode
-            attributes["internet"] = self.connection.internet_state
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Restore the client state from the snapshot.
 
-        if isinstance(self.connection, AsusClientConnectionWlan):
-            attributes["rssi"] = self.connection.rssi
-            attributes["rx_speed"] = self.connection.rx_speed
-            attributes["tx_speed"] = self.connection.tx_speed
+        The restored state is treated as already reported, so the first
+        update with the same state does not fire any events.
+        Raises `TypeError` or `ValueError` if the snapshot is not valid.
+        """
 
-        return clean_dict(attributes)
+        state = ConnectionState(snapshot.get("state"))
+        last_activity = snapshot.get("last_activity")
+        if last_activity is not None:
+            last_activity = datetime.fromisoformat(last_activity)
+        connection_type = snapshot.get("connection_type")
+        if connection_type is not None:
+            connection_type = ConnectionType(connection_type)
+        connected = snapshot.get("connected")
+        if connected is not None:
+            connected = datetime.fromisoformat(connected)
+
+        self._name = snapshot.get("name", self._name)
+        self._vendor = snapshot.get("vendor")
+        self._ip_address = snapshot.get("ip")
+        self._node = snapshot.get("node")
+        self._last_activity = last_activity
+
+        self._connection = connection_type is not None
+        if connection_type is not None:
+            self._connection_type = connection_type
+            self._wlan = snapshot.get("wlan", False)
+            self._guest = snapshot.get("guest")
+            self._guest_id = snapshot.get("guest_id")
+            self._connected_since = connected
+
+        self._state = state
+        self._reported_state = state
+        self._new = False
+        self._identity = None
+        self._extra_state_attributes = None
 
     @property
     def state(self) -> bool | None:
@@ -177,13 +936,41 @@ class ARClient:
 
         return convert_to_ha_state_bool(self._state)
 
+    @property
+    def guest(self) -> bool:
+        """Return if the device is connected to a guest network."""
+
+        return self._wlan and bool(self._guest)
+
+    @property
+    def last_activity(self) -> datetime | None:
+        """Return the time the device was last seen connected."""
+
+        return self._last_activity
+
+    @property
+    def node(self) -> str | None:
+        """Return the MAC address of the AiMesh node."""
+
+        return self._node
+
+    @property
+    def connection_type(self) -> ConnectionType:
+        """Return the connection type."""
+
+        return self._connection_type
+
+    @property
+    def rssi(self) -> int | None:
+        """Return the signal strength of the wireless client."""
+
+        return self._rssi
+
     @property
     def ip_address(self) -> str | None:
         """Return IP address."""
 
-        return (
-            self.connection.ip_address if self.connection is not None else None
-        )
+        return self._ip_address
 
     @property
     def mac_address(self) -> str:
@@ -195,20 +982,75 @@ class ARClient:
     def name(self) -> str | None:
         """Return name."""
 
-        return (
-            self.description.name
-            if self.description is not None
-            else self._name
-        )
+        return self._name
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
 
+        if self._extra_state_attributes is None:
+            self._extra_state_attributes = (
+                self.generate_extra_state_attributes()
+            )
         return self._extra_state_attributes
 
     @property
-    def identity(self) -> dict[str, Any] | None:
+    def identity(self) -> dict[str, Any]:
         """Return identity."""
 
+        if self._identity is None:
+            self._identity = self.generate_identity(self._reported_state)
         return self._identity
+
+
+def select_stale_clients(
+    clients: dict[str, ARClient],
+    limit: int,
+    max_age: timedelta | None,
+    now: datetime,
+) -> set[str]:
+    """Select the clients to be removed.
+
+    Only the disconnected clients are removed. The clients not seen
+    within `max_age` go first, then the least recently seen ones until
+    at most `limit` clients are left. Zero `limit` means no limit.
+    """
+
+    candidates = [
+        (client.last_activity or NEVER_SEEN, mac)
+        for mac, client in clients.items()
+        if client.state is not True
+    ]
+
+    # Clients with unknown last activity are not removed by age
+    stale: set[str] = set()
+    if max_age is not None:
+        cutoff = now - max_age
+        stale = {
+            mac
+            for seen, mac in candidates
+            if seen is not NEVER_SEEN and seen < cutoff
+        }
+
+    excess = len(clients) - len(stale) - limit
+    if limit > 0 and excess > 0:
+        stale.update(
+            mac
+            for _, mac in heapq.nsmallest(
+                excess,
+                (
+                    candidate
+                    for candidate in candidates
+                    if candidate[1] not in stale
+                ),
+            )
+        )
+
+    return stale
+
+
+def _set_value(data: dict[str, Any], key: str, value: Any) -> None:
+    """Set the value unless it is None."""
+
+    if value is not None:
+        data[key] = value
@@ -34,17 +34,27 @@ from .const import (
     ACCESS_POINT,
     ALL_CLIENTS,
     BASE,
+    CONF_ADAPTIVE_INTERVALS,
     CONF_CACHE_TIME,
+    CONF_CACHE_TIMES,
     CONF_CLIENT_DEVICE,
     CONF_CLIENT_FILTER,
     CONF_CLIENT_FILTER_LIST,
+    CONF_CLIENT_FILTER_RULES,
     CONF_CLIENTS_IN_ATTR,
+    CONF_CLIENTS_LIMIT,
+    CONF_CLIENTS_MAX_AGE,
     CONF_CONSIDER_HOME,
     CONF_CREATE_DEVICES,
+    CONF_DEFAULT_ADAPTIVE_INTERVALS,
     CONF_DEFAULT_CACHE_TIME,
+    CONF_DEFAULT_CACHE_TIMES,
     CONF_DEFAULT_CLIENT_DEVICE,
     CONF_DEFAULT_CLIENT_FILTER,
+    CONF_DEFAULT_CLIENT_FILTER_RULES,
     CONF_DEFAULT_CLIENTS_IN_ATTR,
+    CONF_DEFAULT_CLIENTS_LIMIT,
+    CONF_DEFAULT_CLIENTS_MAX_AGE,
     CONF_DEFAULT_CONSIDER_HOME,
     CONF_DEFAULT_CREATE_DEVICES,
     CONF_DEFAULT_EVENT,
@@ -52,11 +62,15 @@ from .const import (
     CONF_DEFAULT_INTERFACES,
     CONF_DEFAULT_INTERVALS,
     CONF_DEFAULT_LATEST_CONNECTED,
+    CONF_DEFAULT_MAX_INTERVAL,
+    CONF_DEFAULT_MAX_REQUESTS,
+    CONF_DEFAULT_MAX_STALE,
     CONF_DEFAULT_MODE,
     CONF_DEFAULT_PORT,
     CONF_DEFAULT_SCAN_INTERVAL,
     CONF_DEFAULT_SPLIT_INTERVALS,
     CONF_DEFAULT_SSL,
+    CONF_DEFAULT_STALE_DATA,
     CONF_DEFAULT_TRACK_DEVICES,
     CONF_DEFAULT_USERNAME,
     CONF_HIDE_PASSWORDS,
@@ -68,8 +82,12 @@ from .const import (
     CONF_LABELS_INTERFACES,
     CONF_LABELS_MODE,
     CONF_LATEST_CONNECTED,
+    CONF_MAX_INTERVAL,
+    CONF_MAX_REQUESTS,
+    CONF_MAX_STALE,
     CONF_MODE,
     CONF_SPLIT_INTERVALS,
+    CONF_STALE_DATA,
     CONF_TRACK_DEVICES,
     CONF_VALUES_MODE,
     CONFIGS,
@@ -488,12 +506,30 @@ def _create_form_connected_devices(
                 )
             )
         ),
+        vol.Optional(
+            CONF_CLIENT_FILTER_RULES,
+            default=user_input.get(
+                CONF_CLIENT_FILTER_RULES, CONF_DEFAULT_CLIENT_FILTER_RULES
+            ),
+        ): cv.string,
         vol.Required(
             CONF_LATEST_CONNECTED,
             default=user_input.get(
                 CONF_LATEST_CONNECTED, CONF_DEFAULT_LATEST_CONNECTED
             ),
         ): cv.positive_int,
+        vol.Required(
+            CONF_CLIENTS_LIMIT,
+            default=user_input.get(
+                CONF_CLIENTS_LIMIT, CONF_DEFAULT_CLIENTS_LIMIT
+            ),
+        ): cv.positive_int,
+        vol.Required(
+            CONF_CLIENTS_MAX_AGE,
+            default=user_input.get(
+                CONF_CLIENTS_MAX_AGE, CONF_DEFAULT_CLIENTS_MAX_AGE
+            ),
+        ): cv.positive_int,
         vol.Required(
             CONF_INTERVAL_DEVICES,
             default=user_input.get(
@@ -543,6 +579,39 @@ def _create_form_intervals(
             CONF_CACHE_TIME,
             default=user_input.get(CONF_CACHE_TIME, CONF_DEFAULT_CACHE_TIME),
         ): cv.positive_int,
+        **{
+            vol.Required(
+                conf,
+                default=user_input.get(conf, CONF_DEFAULT_CACHE_TIMES[conf]),
+            ): cv.positive_int
+            for conf in CONF_CACHE_TIMES.values()
+        },
+        vol.Required(
+            CONF_MAX_REQUESTS,
+            default=user_input.get(
+                CONF_MAX_REQUESTS, CONF_DEFAULT_MAX_REQUESTS
+            ),
+        ): cv.positive_int,
+        vol.Required(
+            CONF_ADAPTIVE_INTERVALS,
+            default=user_input.get(
+                CONF_ADAPTIVE_INTERVALS, CONF_DEFAULT_ADAPTIVE_INTERVALS
+            ),
+        ): cv.boolean,
+        vol.Required(
+            CONF_MAX_INTERVAL,
+            default=user_input.get(
+                CONF_MAX_INTERVAL, CONF_DEFAULT_MAX_INTERVAL
+            ),
+        ): cv.positive_int,
+        vol.Required(
+            CONF_STALE_DATA,
+            default=user_input.get(CONF_STALE_DATA, CONF_DEFAULT_STALE_DATA),
+        ): cv.boolean,
+        vol.Required(
+            CONF_MAX_STALE,
+            default=user_input.get(CONF_MAX_STALE, CONF_DEFAULT_MAX_STALE),
+        ): cv.positive_int,
     }
 
     split = user_input.get(CONF_SPLIT_INTERVALS, CONF_DEFAULT_SPLIT_INTERVALS)
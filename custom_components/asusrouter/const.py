@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from asusrouter.modules.data import AsusData
 from asusrouter.modules.openvpn import AsusOVPNClient, AsusOVPNServer
 from asusrouter.modules.parental_control import (
     AsusBlockAll,
@@ -464,19 +465,35 @@ DEFAULT_SENSORS: dict[str, list[str]] = {CPU: [TOTAL]}
 # CONFIGURATION CONSTANTS & DEFAULTS -->
 
 # Keys
+CONF_ADAPTIVE_INTERVALS = "adaptive_intervals"
 CONF_CACHE_TIME = "cache_time"
+CONF_CACHE_TIMES: dict[AsusData, str] = {
+    datatype: f"{CONF_CACHE_TIME}_{datatype.value}"
+    for datatype in (
+        AsusData.DDNS,
+        AsusData.FIRMWARE,
+        AsusData.OPENVPN_SERVER,
+        AsusData.PORT_FORWARDING,
+        AsusData.WIREGUARD_SERVER,
+    )
+}
 CONF_CERT_PATH = "cert_path"
 CONF_CLIENT_DEVICE = "client_device"
 CONF_CLIENT_FILTER = "client_filter"
 CONF_CLIENT_FILTER_LIST = "client_filter_list"
+CONF_CLIENT_FILTER_RULES = "client_filter_rules"
 CONF_CLIENTS_IN_ATTR = "clients_in_attr"
+CONF_CLIENTS_LIMIT = "clients_limit"
+CONF_CLIENTS_MAX_AGE = "clients_max_age"
 CONF_CONFIRM = "confirm"
 CONF_CONSIDER_HOME = "consider_home"
 CONF_CREATE_DEVICES = "create_devices"
 CONF_ENABLE_CONTROL = "enable_control"
+CONF_EVENT_CLIENTS_CHANGED = "clients_changed"
 CONF_EVENT_DEVICE_CONNECTED = "device_connected"
 CONF_EVENT_DEVICE_DISCONNECTED = "device_disconnected"
 CONF_EVENT_DEVICE_RECONNECTED = "device_reconnected"
+CONF_EVENT_DEVICE_ROAMED = "device_roamed"
 CONF_EVENT_NODE_CONNECTED = "node_connected"
 CONF_EVENT_NODE_DISCONNECTED = "node_disconnected"
 CONF_EVENT_NODE_RECONNECTED = "node_reconnected"
@@ -501,25 +518,42 @@ CONF_INTERVALS = [
     CONF_INTERVAL + WLAN,
 ]
 CONF_LATEST_CONNECTED = "latest_connected"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_MAX_REQUESTS = "max_requests"
+CONF_MAX_STALE = "max_stale"
 CONF_MODE = "mode"
 CONF_SPLIT_INTERVALS = "split_intervals"
+CONF_STALE_DATA = "stale_data"
 CONF_TRACK_DEVICES = "track_devices"
 CONF_UNITS = "units"
 CONF_UNITS_SPEED = "units_speed"
 CONF_UNITS_TRAFFIC = "units_traffic"
 
 # Defaults
+CONF_DEFAULT_ADAPTIVE_INTERVALS = False
 CONF_DEFAULT_CACHE_TIME = 5
+CONF_DEFAULT_CACHE_TIMES: dict[str, int] = {
+    CONF_CACHE_TIMES[AsusData.DDNS]: 300,
+    CONF_CACHE_TIMES[AsusData.FIRMWARE]: 300,
+    CONF_CACHE_TIMES[AsusData.OPENVPN_SERVER]: 300,
+    CONF_CACHE_TIMES[AsusData.PORT_FORWARDING]: 60,
+    CONF_CACHE_TIMES[AsusData.WIREGUARD_SERVER]: 300,
+}
 CONF_DEFAULT_CLIENT_DEVICE = False
 CONF_DEFAULT_CLIENT_FILTER = "no_filter"
+CONF_DEFAULT_CLIENT_FILTER_RULES = ""
 CONF_DEFAULT_CLIENTS_IN_ATTR = True
+CONF_DEFAULT_CLIENTS_LIMIT = 0
+CONF_DEFAULT_CLIENTS_MAX_AGE = 0
 CONF_DEFAULT_CONSIDER_HOME = 45
 CONF_DEFAULT_CREATE_DEVICES = False
 CONF_DEFAULT_ENABLE_CONTROL = False
 CONF_DEFAULT_EVENT: dict[str, bool] = {
+    CONF_EVENT_CLIENTS_CHANGED: True,
     CONF_EVENT_DEVICE_CONNECTED: True,
     CONF_EVENT_DEVICE_DISCONNECTED: False,
     CONF_EVENT_DEVICE_RECONNECTED: False,
+    CONF_EVENT_DEVICE_ROAMED: False,
     CONF_EVENT_NODE_CONNECTED: True,
     CONF_EVENT_NODE_DISCONNECTED: True,
     CONF_EVENT_NODE_RECONNECTED: True,
@@ -528,12 +562,16 @@ CONF_DEFAULT_HIDE_PASSWORDS = False
 CONF_DEFAULT_INTERFACES = [WAN.upper()]
 CONF_DEFAULT_INTERVALS = {CONF_INTERVAL + FIRMWARE: 600}
 CONF_DEFAULT_LATEST_CONNECTED = 5
+CONF_DEFAULT_MAX_INTERVAL = 600
+CONF_DEFAULT_MAX_REQUESTS = 4
+CONF_DEFAULT_MAX_STALE = 60
 CONF_DEFAULT_MODE = ROUTER
 CONF_DEFAULT_PORT = 0
 CONF_DEFAULT_PORTS = {NO_SSL: 80, SSL: 8443}
 CONF_DEFAULT_SCAN_INTERVAL = 30
 CONF_DEFAULT_SPLIT_INTERVALS = False
 CONF_DEFAULT_SSL = True
+CONF_DEFAULT_STALE_DATA = False
 CONF_DEFAULT_TRACK_DEVICES = True
 CONF_DEFAULT_UNITS_SPEED = UnitOfDataRate.MEGABITS_PER_SECOND
 CONF_DEFAULT_UNITS_TRAFFIC = UnitOfInformation.GIGABYTES
@@ -566,19 +604,25 @@ CONF_LABELS_MODE = {
 
 # Options that require restarting the integration
 CONF_REQ_RELOAD = [
+    CONF_ADAPTIVE_INTERVALS,
     CONF_CACHE_TIME,
     CONF_CERT_PATH,
     CONF_CLIENT_DEVICE,
     CONF_CLIENT_FILTER,
     CONF_CLIENT_FILTER_LIST,
+    CONF_CLIENT_FILTER_RULES,
     CONF_CLIENTS_IN_ATTR,
+    CONF_CLIENTS_LIMIT,
+    CONF_CLIENTS_MAX_AGE,
     CONF_CONFIRM,
     CONF_CONSIDER_HOME,
     CONF_CREATE_DEVICES,
     CONF_ENABLE_CONTROL,
+    CONF_EVENT_CLIENTS_CHANGED,
     CONF_EVENT_DEVICE_CONNECTED,
     CONF_EVENT_DEVICE_DISCONNECTED,
     CONF_EVENT_DEVICE_RECONNECTED,
+    CONF_EVENT_DEVICE_ROAMED,
     CONF_EVENT_NODE_CONNECTED,
     CONF_EVENT_NODE_DISCONNECTED,
     CONF_EVENT_NODE_RECONNECTED,
@@ -586,12 +630,17 @@ CONF_REQ_RELOAD = [
     CONF_INTERFACES,
     CONF_INTERVAL_DEVICES,
     CONF_LATEST_CONNECTED,
+    CONF_MAX_INTERVAL,
+    CONF_MAX_REQUESTS,
+    CONF_MAX_STALE,
     CONF_MODE,
     CONF_SPLIT_INTERVALS,
     CONF_SCAN_INTERVAL,
+    CONF_STALE_DATA,
     CONF_TRACK_DEVICES,
 ]
 CONF_REQ_RELOAD.extend(CONF_INTERVALS)
+CONF_REQ_RELOAD.extend(CONF_CACHE_TIMES.values())
 
 # Input values
 CONF_VALUES_DATA = [
@@ -802,6 +851,62 @@ TO_REDACT_ATTRS: list[str] = [
 
 # <-- DIAGNOSTICS
 
+# CIRCUIT BREAKER -->
+
+# Consecutive connection failures after which the device is considered
+# unreachable and the requests are stopped
+BREAKER_THRESHOLD = 3
+# Delay (in seconds) before the first probe request. It is doubled
+# with each failed probe up to the maximum value
+BREAKER_DELAY = 10.0
+BREAKER_MAX_DELAY = 600.0
+
+# <-- CIRCUIT BREAKER
+
+# EVENTS -->
+
+# Minimum time (in seconds) between the same events of a single device
+EVENT_RATE_LIMIT = 60.0
+# Number of the latest roams kept for each client
+ROAMING_HISTORY = 10
+
+# <-- EVENTS
+
+# CLIENTS EVICTION -->
+
+# How often (in seconds) the stale clients are checked
+EVICTION_INTERVAL = 3600
+
+# <-- CLIENTS EVICTION
+
+# SCHEDULER -->
+
+# Groups due within this window (in seconds) are polled in one batch
+SCHEDULER_BATCH_WINDOW = 1.0
+# Maximum random delay (in seconds) added to each poll
+SCHEDULER_JITTER = 2.0
+
+# Adaptive intervals are stretched by this factor while the data
+# does not change and reset to the configured value on a change
+SCHEDULER_ADAPTIVE_FACTOR = 1.5
+
+# <-- SCHEDULER
+
+# STORAGE -->
+
+STORAGE_CACHE_KEY = "key"
+STORAGE_CLIENTS = "clients"
+STORAGE_SENSORS = "sensors"
+STORAGE_VERSION = 1
+
+# Maximum delay (in seconds) before the changed clients are written
+STORAGE_CLIENTS_DELAY = 60
+
+# List of all the stores of a config entry
+STORAGES: list[str] = [STORAGE_CLIENTS, STORAGE_SENSORS]
+
+# <-- STORAGE
+
 # SERVICES -->
 
 SERVICE_ALLOWED_ADJUST_GWLAN: dict[str, Callable | None] = {
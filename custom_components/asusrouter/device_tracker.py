@@ -188,7 +188,7 @@ class ARDeviceEntity(ScannerEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                self._router.signal_device_update,
+                self._router.signal_client_update(self._client.mac_address),
                 self.async_on_demand_update,
             )
         )
@@ -31,6 +31,18 @@ async def async_get_config_entry_diagnostics(
 
     router: ARDevice = hass.data[DOMAIN][entry.entry_id][ASUSROUTER]
 
+    # Current update intervals of the sensor groups
+    data["intervals"] = router.intervals
+
+    # Stored clients and the stale clients removed since the setup
+    data["clients"] = router.clients_stats
+
+    # Time spent on the different stages of the setup
+    data["timings"] = {
+        "discovery": router.bridge.discovery_time,
+        "first_refresh": router.refresh_time,
+    }
+
     # Gather information how this device is represented in Home Assistant
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
@@ -182,7 +182,7 @@ class ARBinaryEntity(AREntity):
         """Set switch state."""
         try:
             _LOGGER.debug("Setting state to %s", state)
-            result = await self.api.async_set_state(
+            result = await self.router.bridge.async_set_state(
                 state=state, expect_modify=expect_modify, **kwargs
             )
             await self.coordinator.async_request_refresh()
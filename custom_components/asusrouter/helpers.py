@@ -25,6 +25,75 @@ def flatten_dict(obj: Any, keystring: str = "", delimiter: str = "_"):
         yield keystring, obj
 
 
+class FlatLayout:
+    """Precomputed layout of a nested dictionary.
+
+    The layout is learned once from a sample. Any later dictionary
+    with the same structure is flattened by walking the stored paths,
+    without recursion and without building the keys again.
+    The result is the same as of `flatten_dict`.
+    """
+
+    def __init__(self, sample: Any, delimiter: str = "_") -> None:
+        """Learn the layout from the sample."""
+
+        self._delimiter = delimiter
+        self._scalar = not isinstance(sample, dict)
+        # Nested dicts as (parent index, key, number of keys)
+        # with the root dict at the index 0
+        self._nodes: list[tuple[int, Any, int]] = []
+        # Values as (flat key, parent index, key)
+        self._leaves: list[tuple[str, int, Any]] = []
+
+        if not self._scalar:
+            self._nodes.append((-1, None, len(sample)))
+            self._learn(sample, 0, "")
+
+    def _learn(self, obj: dict[Any, Any], index: int, keystring: str) -> None:
+        """Learn the layout of a nested dict."""
+
+        for key, value in obj.items():
+            flat_key = (
+                f"{keystring}{self._delimiter}{key}" if keystring else str(key)
+            )
+            if isinstance(value, dict):
+                self._nodes.append((index, key, len(value)))
+                self._learn(value, len(self._nodes) - 1, flat_key)
+            else:
+                self._leaves.append((flat_key, index, key))
+
+    def flatten(self, obj: Any) -> dict[str, Any] | None:
+        """Flatten the dictionary.
+
+        Returns `None` if the dictionary does not match the layout.
+        """
+
+        if self._scalar:
+            return None if isinstance(obj, dict) else {"": obj}
+
+        if not isinstance(obj, dict):
+            return None
+
+        nodes: list[dict[Any, Any]] = []
+        try:
+            for parent, key, size in self._nodes:
+                node = obj if parent < 0 else nodes[parent][key]
+                if not isinstance(node, dict) or len(node) != size:
+                    return None
+                nodes.append(node)
+
+            result: dict[str, Any] = {}
+            for flat_key, parent, key in self._leaves:
+                value = nodes[parent][key]
+                if isinstance(value, dict):
+                    return None
+                result[flat_key] = value
+        except KeyError:
+            return None
+
+        return result
+
+
 def as_dict(pyobj):
     """Return generator object as dictionary."""
 
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime, timedelta
+from functools import partial
 import logging
+import time
 from typing import Any
 
 from asusrouter.error import AsusRouterError
-from asusrouter.modules.client import AsusClientConnectionWlan
+from asusrouter.modules.aimesh import AiMeshDevice
+from asusrouter.modules.client import AsusClient
 from asusrouter.modules.connection import ConnectionState, ConnectionType
 from asusrouter.modules.identity import AsusDevice
 from asusrouter.modules.parental_control import ParentalControlRule
@@ -31,7 +35,11 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo, format_mac
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -39,33 +47,62 @@ from homeassistant.helpers.update_coordinator import (
 
 from .aimesh import AiMeshNode
 from .bridge import ARBridge
-from .client import ARClient
+from .client import (
+    ARClient,
+    ARClientChange,
+    ARClientFilter,
+    ARClientsDiff,
+    ARClientsEvents,
+    ARClientsExpiry,
+    ARClientsRoaming,
+    ARLatestClients,
+    ARNodeLoad,
+    ARNodesLoad,
+    select_stale_clients,
+)
 from .const import (
     ACCESS_POINT,
     AIMESH,
+    CONF_ADAPTIVE_INTERVALS,
     CONF_CLIENT_DEVICE,
     CONF_CLIENT_FILTER,
     CONF_CLIENT_FILTER_LIST,
+    CONF_CLIENT_FILTER_RULES,
     CONF_CLIENTS_IN_ATTR,
+    CONF_CLIENTS_LIMIT,
+    CONF_CLIENTS_MAX_AGE,
     CONF_CREATE_DEVICES,
+    CONF_DEFAULT_ADAPTIVE_INTERVALS,
     CONF_DEFAULT_CLIENT_DEVICE,
     CONF_DEFAULT_CLIENT_FILTER,
+    CONF_DEFAULT_CLIENT_FILTER_RULES,
     CONF_DEFAULT_CLIENTS_IN_ATTR,
+    CONF_DEFAULT_CLIENTS_LIMIT,
+    CONF_DEFAULT_CLIENTS_MAX_AGE,
     CONF_DEFAULT_CONSIDER_HOME,
     CONF_DEFAULT_CREATE_DEVICES,
     CONF_DEFAULT_EVENT,
     CONF_DEFAULT_INTERVALS,
     CONF_DEFAULT_LATEST_CONNECTED,
+    CONF_DEFAULT_MAX_INTERVAL,
+    CONF_DEFAULT_MAX_REQUESTS,
     CONF_DEFAULT_MODE,
     CONF_DEFAULT_PORT,
     CONF_DEFAULT_PORTS,
     CONF_DEFAULT_SCAN_INTERVAL,
     CONF_DEFAULT_SPLIT_INTERVALS,
     CONF_DEFAULT_TRACK_DEVICES,
+    CONF_EVENT_CLIENTS_CHANGED,
+    CONF_EVENT_DEVICE_CONNECTED,
+    CONF_EVENT_DEVICE_DISCONNECTED,
+    CONF_EVENT_DEVICE_RECONNECTED,
+    CONF_EVENT_DEVICE_ROAMED,
     CONF_EVENT_NODE_CONNECTED,
     CONF_INTERVAL,
     CONF_INTERVAL_DEVICES,
     CONF_LATEST_CONNECTED,
+    CONF_MAX_INTERVAL,
+    CONF_MAX_REQUESTS,
     CONF_MODE,
     CONF_REQ_RELOAD,
     CONF_SPLIT_INTERVALS,
@@ -74,6 +111,8 @@ from .const import (
     COORDINATOR,
     DEVICES,
     DOMAIN,
+    EVENT_RATE_LIMIT,
+    EVICTION_INTERVAL,
     FIRMWARE,
     LIST,
     MAC,
@@ -81,13 +120,21 @@ from .const import (
     METHOD,
     NO_SSL,
     NUMBER,
+    ROAMING_HISTORY,
     ROUTER,
+    SCHEDULER_ADAPTIVE_FACTOR,
     SENSORS,
     SENSORS_AIMESH,
     SENSORS_CONNECTED_DEVICES,
     SSL,
+    STORAGE_CACHE_KEY,
+    STORAGE_CLIENTS,
+    STORAGE_CLIENTS_DELAY,
+    STORAGE_SENSORS,
 )
 from .helpers import as_dict
+from .scheduler import ARPollScheduler
+from .storage import get_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -122,6 +169,27 @@ class ARSensorHandler:
         self._aimesh_list: list[dict[str, Any]] = []
         self._gn_clients_number: int = 0
 
+        # Time spent on the first refresh of each coordinator
+        self._refresh_time: dict[str, float] = {}
+
+        self._coordinators: dict[str, DataUpdateCoordinator] = {}
+
+        # Single scheduler for all the polled coordinators
+        self.scheduler = ARPollScheduler(
+            hass,
+            options.get(CONF_MAX_REQUESTS, CONF_DEFAULT_MAX_REQUESTS),
+        )
+
+        # Adaptive intervals
+        self._adaptive = options.get(
+            CONF_ADAPTIVE_INTERVALS, CONF_DEFAULT_ADAPTIVE_INTERVALS
+        )
+        self._adaptive_max = timedelta(
+            seconds=options.get(CONF_MAX_INTERVAL, CONF_DEFAULT_MAX_INTERVAL)
+        )
+        self._adaptive_base: dict[str, timedelta] = {}
+        self._adaptive_data: dict[str, dict[str, Any]] = {}
+
     async def _get_clients(self) -> dict[str, Any]:
         """Return clients sensors."""
 
@@ -236,14 +304,34 @@ class ARSensorHandler:
                 )
             )
 
+        # Data revalidated in the background is pushed to the coordinator
+        # without waiting for the next poll
+        if should_poll:
+            method = partial(
+                self.bridge.async_get_data,
+                method,
+                partial(self._revalidated, sensor_type),
+            )
+
+        # Track changes of the data to adapt the interval
+        if should_poll and self._adaptive:
+            self._adaptive_base[sensor_type] = update_interval
+            method = self._adaptive_method(sensor_type, method)
+
         # Coordinator
+        # Polling is done by the scheduler, so that all the groups
+        # of the router are not requested at the same moment
         coordinator = DataUpdateCoordinator(
             self.hass,
             _LOGGER,
             name=sensor_type,
             update_method=method,
-            update_interval=update_interval if should_poll else None,
+            update_interval=None,
+            always_update=False,
         )
+        if should_poll:
+            self.scheduler.add(sensor_type, coordinator, update_interval)
+        self._coordinators[sensor_type] = coordinator
 
         _LOGGER.debug(
             "Coordinator initialized for `%s`. Update interval: `%s`",
@@ -251,16 +339,116 @@ class ARSensorHandler:
             update_interval,
         )
 
-        # Update coordinator
-        await coordinator.async_refresh()
-
         return coordinator
 
+    def _adaptive_method(
+        self,
+        sensor_type: str,
+        method: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> Callable[[], Awaitable[dict[str, Any]]]:
+        """Wrap the update method to adapt the interval to the data."""
+
+        async def _update() -> dict[str, Any]:
+            """Update the data and adapt the interval."""
+
+            data = await method()
+            self._adapt_data(sensor_type, data)
+            return data
+
+        return _update
+
+    @callback
+    def _adapt_data(self, sensor_type: str, data: dict[str, Any]) -> None:
+        """Adapt the interval to the new data of the group."""
+
+        self._adapt_interval(
+            sensor_type, data != self._adaptive_data.get(sensor_type)
+        )
+        self._adaptive_data[sensor_type] = data
+
+    @callback
+    def _revalidated(self, sensor_type: str, data: dict[str, Any]) -> None:
+        """Push the data revalidated in the background to the coordinator."""
+
+        coordinator = self._coordinators.get(sensor_type)
+        if coordinator is None:
+            return
+
+        _LOGGER.debug("Revalidated data of `%s` has changed", sensor_type)
+        if self._adaptive:
+            self._adapt_data(sensor_type, data)
+        coordinator.async_set_updated_data(data)
+
+    @callback
+    def _adapt_interval(self, sensor_type: str, changed: bool) -> None:
+        """Adapt the interval of the group to the data changes.
+
+        While the data does not change, the interval is stretched
+        towards the maximum interval. As soon as the data changes,
+        the configured interval is restored.
+        """
+
+        base = self._adaptive_base[sensor_type]
+        current = self.scheduler.get_interval(sensor_type) or base
+
+        interval = (
+            base
+            if changed
+            else max(
+                base,
+                min(self._adaptive_max, current * SCHEDULER_ADAPTIVE_FACTOR),
+            )
+        )
+
+        if interval != current:
+            _LOGGER.debug(
+                "Interval for `%s` changed to `%s`", sensor_type, interval
+            )
+            self.scheduler.set_interval(sensor_type, interval)
+
+    async def async_first_refresh(
+        self,
+        coordinators: dict[str, DataUpdateCoordinator],
+    ) -> None:
+        """Refresh the coordinators for the first time.
+
+        All the coordinators are refreshed concurrently, so the setup time
+        depends on the slowest group instead of the sum of all of them.
+        The number of simultaneous requests is limited by the bridge.
+        """
+
+        async def _refresh(
+            sensor_type: str,
+            coordinator: DataUpdateCoordinator,
+        ) -> None:
+            """Refresh a single coordinator and measure the time."""
+
+            start = time.monotonic()
+            await coordinator.async_refresh()
+            self._refresh_time[sensor_type] = round(
+                time.monotonic() - start, 3
+            )
+
+        await asyncio.gather(
+            *(
+                _refresh(sensor_type, coordinator)
+                for sensor_type, coordinator in coordinators.items()
+            )
+        )
+
+        _LOGGER.debug("First refresh of coordinators: %s", self._refresh_time)
+
+    @property
+    def refresh_time(self) -> dict[str, float]:
+        """Return time spent on the first refresh of each coordinator."""
+
+        return self._refresh_time
+
 
 class ARDevice:
     """Representatiion of AsusRouter."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0915
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
@@ -295,15 +483,49 @@ class ARDevice:
         # Device sensors
         self._sensor_handler: ARSensorHandler | None = None
         self._sensor_coordinator: dict[str, Any] = {}
+        self._sensors_store = get_store(
+            hass, config_entry.entry_id, STORAGE_SENSORS
+        )
 
         self._aimesh: dict[str, Any] = {}
         self._clients: dict[str, Any] = {}
+        self._clients_store = get_store(
+            hass, config_entry.entry_id, STORAGE_CLIENTS
+        )
+        self._clients_save_pending = False
+        # Clients hidden by the clients filter
+        self._hidden_clients: dict[str, ARClient] = {}
+        # Connected clients of each AiMesh node
+        self._nodes_load = ARNodesLoad()
+        self._roaming = ARClientsRoaming(ROAMING_HISTORY)
+        # Clients reported by the device during the latest update
+        self._clients_seen: set[str] = set()
+        # Known clients which have not been updated yet
+        self._clients_unsynced: set[str] = set()
+        # Connected clients and clients of the guest networks
+        self._connected_clients: set[str] = set()
+        self._guest_clients: set[str] = set()
+        # Connected clients are marked as disconnected when they are not
+        # seen for the consider home time
+        self._consider_home = timedelta(
+            seconds=self._options.get(
+                CONF_CONSIDER_HOME, CONF_DEFAULT_CONSIDER_HOME
+            )
+        )
+        self._expiry = ARClientsExpiry()
+        self._expiry_cancel: CALLBACK_TYPE | None = None
+        self._expiry_time: datetime | None = None
         self._clients_number: int = 0
         self._clients_list: list[dict[str, Any]] = []
         self._aimesh_number: int = 0
         self._aimesh_list: list[dict[str, Any]] = []
         self._latest_connected: datetime | None = None
         self._latest_connected_list: list[dict[str, Any]] = []
+        self._latest_clients = ARLatestClients(
+            self._options.get(
+                CONF_LATEST_CONNECTED, CONF_DEFAULT_LATEST_CONNECTED
+            )
+        )
         self._connect_error: bool = False
         self._gn_clients_number: int = 0
 
@@ -329,12 +551,38 @@ class ARDevice:
         self._pc_rules: dict[str, Any] = {}
 
         # Client filter
-        self._client_filter: str = self._options.get(
-            CONF_CLIENT_FILTER, CONF_DEFAULT_CLIENT_FILTER
+        self._client_filter = ARClientFilter(
+            self._options.get(CONF_CLIENT_FILTER, CONF_DEFAULT_CLIENT_FILTER),
+            self._options.get(CONF_CLIENT_FILTER_LIST, []),
+            self._options.get(
+                CONF_CLIENT_FILTER_RULES, CONF_DEFAULT_CLIENT_FILTER_RULES
+            ).split(","),
+        )
+
+        # Stale clients eviction
+        self._clients_limit: int = self._options.get(
+            CONF_CLIENTS_LIMIT, CONF_DEFAULT_CLIENTS_LIMIT
         )
-        self._client_filter_list: list[str] = self._options.get(
-            CONF_CLIENT_FILTER_LIST, []
+        # No age limit for zero days
+        self._clients_max_age = (
+            timedelta(
+                days=self._options.get(
+                    CONF_CLIENTS_MAX_AGE, CONF_DEFAULT_CLIENTS_MAX_AGE
+                )
+            )
+            or None
+        )
+        self._evicted_clients = 0
+        # Disabled trackers of the removed stale clients
+        self._evicted_trackers: dict[str, str] = {}
+
+        # Events
+        self._events_enabled = frozenset(
+            event
+            for event, default in CONF_DEFAULT_EVENT.items()
+            if self._options.get(event, default) is True
         )
+        self._client_events = ARClientsEvents(EVENT_RATE_LIMIT)
 
         # On-close parameters
         self._on_close: list[Callable] = []
@@ -407,23 +655,30 @@ class ARDevice:
             # shows that device_tracker entry can exist without a MAC address
             if isinstance(capabilities, dict) and "mac" in capabilities:
                 mac = capabilities["mac"]
+
+                # Trackers of the removed stale clients are disabled
+                # by the integration until the client is back
+                if entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+                    self._evicted_trackers[mac] = entry.entity_id
+                    continue
+
                 self._clients[mac] = ARClient(mac)
 
                 # Create devices when tracker was enabled
                 disabled_by = entry.disabled_by
                 if disabled_by is None:
                     self._clients[mac].device = True
+        self._clients_unsynced = set(self._clients)
+
+        # Restore the clients state from the previous run
+        await self._async_restore_clients()
 
         # Mode-specific
         if self._mode in (ACCESS_POINT, MEDIA_BRIDGE, ROUTER):
-            # Update AiMesh
-            await self.update_nodes()
-
-            # Update clients
-            await self.update_clients()
-
-            # Update parental control
-            await self.update_pc_rules()
+            # Update clients, AiMesh and parental control
+            await self.update_all()
+            # Expire the restored clients even if the update has failed
+            self._schedule_expiry_timer()
         else:
             _LOGGER.debug(
                 "Device is in AiMesh node mode. Device tracking and "
@@ -431,23 +686,14 @@ class ARDevice:
             )
 
         # Clients filter
-        match self._client_filter:
-            case "include":
-                _LOGGER.debug("Setting clients filter: `include`")
-                self._clients = {
-                    mac: client
-                    for mac, client in self._clients.items()
-                    if mac in self._client_filter_list
-                }
-            case "exclude":
-                _LOGGER.debug("Setting clients filter: `exclude`")
-                self._clients = {
-                    mac: client
-                    for mac, client in self._clients.items()
-                    if mac not in self._client_filter_list
-                }
-            case _:
-                _LOGGER.debug("Setting clients filter: `no_filter`")
+        _LOGGER.debug("Setting clients filter: `%s`", self._client_filter.mode)
+        filtered = [
+            mac for mac in self._clients if not self._client_filter.allows(mac)
+        ]
+        for mac in filtered:
+            self._remove_client(mac)
+        self._count_clients(filtered)
+        self._evict_clients()
 
         # Initialize sensor coordinators
         await self._init_sensor_coordinators()
@@ -467,21 +713,65 @@ class ARDevice:
                 ),
             )
         )
+        self.async_on_close(self._cancel_expiry_timer)
+        if self._clients_limit > 0 or self._clients_max_age is not None:
+            self.async_on_close(
+                async_track_time_interval(
+                    self.hass,
+                    self._evict_clients,
+                    timedelta(seconds=EVICTION_INTERVAL),
+                )
+            )
 
     async def update_all(
         self,
         now: datetime | None = None,
     ) -> None:
-        """Update all AsusRouter platforms."""
+        """Update all AsusRouter platforms.
 
-        if self._mode in (ACCESS_POINT, MEDIA_BRIDGE, ROUTER):
-            await self.update_clients()
-            await self.update_nodes()
-            await self.update_pc_rules()
+        The data is requested concurrently and applied in a fixed order,
+        then all the signals are sent at once.
+        """
+
+        if self._mode not in (ACCESS_POINT, MEDIA_BRIDGE, ROUTER):
+            return
+
+        api_clients, aimesh, pc_data = await asyncio.gather(
+            self._async_get_clients(),
+            self._async_get_nodes(),
+            self._async_get_pc_rules(),
+        )
+
+        signals: list[str] = []
+        if api_clients is not None:
+            signals.extend(self._apply_clients(api_clients))
+        if aimesh is not None:
+            signals.extend(self._apply_nodes(aimesh))
+        if pc_data is not None:
+            signals.extend(self._apply_pc_rules(pc_data))
+        self._send_signals(signals)
+
+        await self._update_unpolled_sensors()
+
+    def _send_signals(self, signals: list[str]) -> None:
+        """Send dispatcher signals."""
 
-    async def update_clients(self) -> None:  # noqa: C901, PLR0912, PLR0915
+        for signal in signals:
+            async_dispatcher_send(self.hass, signal)
+
+    async def update_clients(self) -> None:
         """Update AsusRouter clients."""
 
+        api_clients = await self._async_get_clients()
+        if api_clients is None:
+            return
+
+        self._send_signals(self._apply_clients(api_clients))
+        await self._update_unpolled_sensors()
+
+    async def _async_get_clients(self) -> dict[str, AsusClient] | None:
+        """Get AsusRouter clients."""
+
         # Check clients tracking settings
         if (
             self._options.get(CONF_TRACK_DEVICES, CONF_DEFAULT_TRACK_DEVICES)
@@ -513,34 +803,34 @@ class ARDevice:
                     self._conf_host,
                     ex,
                 )
-            return
+            return None
 
         # Notify about reconnection
         if self._connect_error:
             self._connect_error = False
             _LOGGER.info("Reconnected to '%s'", self._conf_host)
 
-        # Get the consider home settings
-        consider_home = self._options.get(
-            CONF_CONSIDER_HOME, CONF_DEFAULT_CONSIDER_HOME
-        )
+        return api_clients
+
+    def _apply_clients(self, api_clients: dict[str, AsusClient]) -> list[str]:
+        """Apply the new clients data and return the signals to send.
+
+        Only the clients which have changed since the previous update
+        affect the sensors, so an update without changes is cheap.
+        """
 
         # Format clients MAC
         clients = {
             format_mac(mac): client for mac, client in api_clients.items()
         }
+        seen = set(clients)
+        diff = ARClientsDiff()
 
         # Update known clients
-        for client_mac, client_state in self._clients.items():
-            client_info = clients.pop(client_mac, None)
-            client_state.update(
-                client_info,
-                consider_home,
-                event_call=self.fire_event,
-            )
+        self._update_known_clients(clients, diff)
+        self._clients_seen = seen
 
         # Add new clients
-        new_clients = []
         new_client = False
 
         for client_mac, client_info in clients.items():
@@ -552,9 +842,6 @@ class ARDevice:
             if state is not ConnectionState.CONNECTED:
                 continue
 
-            # Flag that new client is added
-            new_client = True
-
             # Create new client and process it
             client_name = (
                 client_info.description.name
@@ -564,116 +851,394 @@ class ARDevice:
             client = ARClient(client_mac, client_name)
             client.update(
                 client_info,
-                consider_home,
                 event_call=self.fire_event,
             )
-
-            # Add client to the storage
-            self._clients[client_mac] = client
-
-            # Add client to the list of new clients
-            new_clients.append(client)
-
-        # Notify about new clients
-        for client in new_clients:
+            self._schedule_expiry(client_mac, client)
+            diff.added.add(client_mac)
+
+            # Add client to the storage. Clients hidden by the filter
+            # are only used for the sensors
+            if self._client_filter.allows(client_mac):
+                self._clients[client_mac] = client
+                new_client = True
+            else:
+                self._hidden_clients[client_mac] = client
+
+            # Notify about new client
             _LOGGER.debug("New client: %s", client.identity)
             self.fire_event(
-                "device_connected",
+                CONF_EVENT_DEVICE_CONNECTED,
                 client.identity,
             )
 
-        # Connected clients sensor
-        self._clients_number = 0
-        self._clients_list = []
+        # Clients which have expired since the previous update
+        diff.changed |= self._expire_clients(datetime.now(UTC))
 
-        # Connected GuestNetwork clients sensor
-        self._gn_clients_number = 0
+        self._schedule_expiry_timer()
+        self._fire_clients_changed()
+        if diff:
+            self._save_clients()
+
+        # Enable the trackers of the returning clients
+        if self._evicted_trackers and diff.added:
+            self._enable_trackers(diff.added)
+
+        # Keep the number of clients within the limit
+        if (
+            0
+            < self._clients_limit
+            < len(self._clients) + len(self._hidden_clients)
+        ):
+            self._evict_clients()
+
+        # Update the sensors only if something has changed
+        if diff.added or diff.changed:
+            self._count_clients(diff.added | diff.changed)
+
+            # Update latest connected sensors
+            self.update_latest_connected(diff.added | diff.changed)
+
+        # Notify only the changed clients and nodes
+        nodes = self._update_nodes_load(
+            diff.added | diff.removed | diff.changed | diff.updated
+        )
+        signals = [
+            self.signal_client_update(mac)
+            for mac in sorted(diff.changed | diff.updated)
+        ]
+        signals.extend(self.signal_node_update(node) for node in sorted(nodes))
+        if new_client:
+            signals.append(self.signal_device_new)
+        return signals
+
+    def _update_known_clients(
+        self,
+        clients: dict[str, AsusClient],
+        diff: ARClientsDiff,
+    ) -> None:
+        """Update known clients, including the ones hidden by the filter.
+
+        Only the reported clients, the clients reported during the
+        previous update and the clients not updated yet are checked.
+        Other known clients cannot change. The processed clients are
+        removed from `clients`.
+        """
+
+        macs = sorted(
+            self._clients_unsynced | self._clients_seen | clients.keys()
+        )
+        self._clients_unsynced.clear()
 
-        for client_mac, client in self._clients.items():
-            if client.state:
-                self._clients_number += 1
-                self._clients_list.append(client.identity)
+        for client_mac in macs:
+            client_state = self._clients.get(client_mac)
+            if client_state is None:
+                client_state = self._hidden_clients.get(client_mac)
+            if client_state is None:
+                continue
 
+            client_info = clients.pop(client_mac, None)
+            if client_info is None and client_mac in self._clients_seen:
+                diff.removed.add(client_mac)
+            change = client_state.update(
+                client_info,
+                event_call=self.fire_event,
+            )
+            if change is ARClientChange.IDENTITY:
+                diff.changed.add(client_mac)
+            elif change is ARClientChange.ATTRIBUTES:
+                diff.updated.add(client_mac)
+
+            # Postpone the expiry of the connected client
             if (
-                isinstance(client.connection, AsusClientConnectionWlan)
-                and client.connection.guest
+                client_info is not None
+                and client_info.state is ConnectionState.CONNECTED
             ):
-                self._gn_clients_number += 1
-
-        # Filter clients
-        # Only include the listed clients
-        if self._client_filter == "include":
-            self._clients = {
-                mac: client
-                for mac, client in self._clients.items()
-                if mac in self._client_filter_list
-            }
-        # Exclude the listed clients
-        elif self._client_filter == "exclude":
-            self._clients = {
-                mac: client
-                for mac, client in self._clients.items()
-                if mac not in self._client_filter_list
+                self._schedule_expiry(client_mac, client_state)
+
+    async def _async_restore_clients(self) -> None:
+        """Restore the state of the known clients from the storage."""
+
+        stored = await self._clients_store.async_load()
+        if not isinstance(stored, dict):
+            return
+
+        restored: set[str] = set()
+        for mac, snapshot in stored.get(STORAGE_CLIENTS, {}).items():
+            client = self._clients.get(mac)
+            if client is None:
+                continue
+            try:
+                client.restore(snapshot)
+            except (TypeError, ValueError) as ex:
+                _LOGGER.debug("Cannot restore client `%s`: %s", mac, ex)
+                continue
+            if client.state is True:
+                self._schedule_expiry(mac, client)
+            restored.add(mac)
+
+        # The restored state is already reported, so the sensors
+        # do not get it from the updates
+        self._count_clients(restored)
+        self.update_latest_connected(restored)
+        self._update_nodes_load(restored)
+
+        _LOGGER.debug("Restored %s clients", len(restored))
+
+    @callback
+    def _save_clients(self) -> None:
+        """Schedule writing the clients state to the storage.
+
+        All the changes until the write are saved together.
+        """
+
+        if self._clients_save_pending:
+            return
+
+        self._clients_save_pending = True
+        self._clients_store.async_delay_save(
+            self._clients_snapshot, STORAGE_CLIENTS_DELAY
+        )
+
+    @callback
+    def _clients_snapshot(self) -> dict[str, Any]:
+        """Get the clients state to be written to the storage."""
+
+        self._clients_save_pending = False
+        return {
+            STORAGE_CLIENTS: {
+                mac: client.snapshot() for mac, client in self._clients.items()
             }
+        }
 
-        async_dispatcher_send(self.hass, self.signal_device_update)
-        if new_client:
-            async_dispatcher_send(self.hass, self.signal_device_new)
+    @callback
+    def _evict_clients(self, now: datetime | None = None) -> None:
+        """Remove the stale clients and disable their trackers."""
+
+        if self._clients_limit == 0 and self._clients_max_age is None:
+            return
+
+        stale = select_stale_clients(
+            {**self._clients, **self._hidden_clients},
+            self._clients_limit,
+            self._clients_max_age,
+            now or datetime.now(UTC),
+        )
+        if not stale:
+            return
+
+        nodes: set[str] = set()
+        for mac in stale:
+            nodes |= self._remove_client(mac)
+        self._evicted_clients += len(stale)
+        _LOGGER.debug("Removed %s stale clients", len(stale))
+
+        # Disable the trackers in a single pass over the registry
+        entity_reg = er.async_get(self.hass)
+        for entry in er.async_entries_for_config_entry(
+            entity_reg, self._config_entry.entry_id
+        ):
+            if entry.domain != "device_tracker" or entry.disabled_by:
+                continue
+            capabilities = entry.capabilities
+            if isinstance(capabilities, dict) and (
+                capabilities.get("mac") in stale
+            ):
+                entity_reg.async_update_entity(
+                    entry.entity_id,
+                    disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                )
+                self._evicted_trackers[capabilities["mac"]] = entry.entity_id
+
+        self._count_clients(stale)
+        self._save_clients()
+        self._send_signals(
+            [self.signal_node_update(node) for node in sorted(nodes)]
+        )
+
+    @callback
+    def _enable_trackers(self, macs: set[str]) -> None:
+        """Enable the trackers of the removed stale clients.
+
+        The config entry is reloaded by Home Assistant after the tracker
+        is enabled, so the tracker entity is added again.
+        """
+
+        entity_reg = er.async_get(self.hass)
+        for mac in macs & self._evicted_trackers.keys():
+            entity_id = self._evicted_trackers.pop(mac)
+            entry = entity_reg.async_get(entity_id)
+            disabled_by = entry.disabled_by if entry is not None else None
+            if disabled_by is not er.RegistryEntryDisabler.INTEGRATION:
+                continue
+            _LOGGER.debug("Enabling the tracker of returning client %s", mac)
+            entity_reg.async_update_entity(entity_id, disabled_by=None)
+
+    @callback
+    def _remove_client(self, mac: str) -> set[str]:
+        """Forget the client in all the clients indexes.
+
+        Returns the AiMesh nodes which have lost the client.
+        """
+
+        self._clients.pop(mac, None)
+        self._hidden_clients.pop(mac, None)
+        self._clients_seen.discard(mac)
+        self._expiry.cancel(mac)
+        self._roaming.remove(mac)
+
+        if self._latest_clients.remove(mac):
+            self._latest_connected_list = self._latest_clients.clients
+            self._latest_connected = (
+                self._latest_connected_list[-1].get(CONNECTED)
+                if self._latest_connected_list
+                else None
+            )
+
+        return self._nodes_load.update(mac, None)
+
+    def _schedule_expiry(self, mac: str, client: ARClient) -> None:
+        """Schedule the client expiry after the consider home time."""
+
+        if client.last_activity is not None:
+            self._expiry.schedule(
+                mac, client.last_activity + self._consider_home
+            )
+
+    def _schedule_expiry_timer(self) -> None:
+        """Schedule the timer for the next clients expiry."""
+
+        next_expiry = self._expiry.next_expiry
+        if next_expiry == self._expiry_time:
+            return
+
+        self._cancel_expiry_timer()
+        if next_expiry is None:
+            return
+
+        self._expiry_time = next_expiry
+        self._expiry_cancel = async_track_point_in_utc_time(
+            self.hass, self._async_expire_clients, next_expiry
+        )
+
+    def _cancel_expiry_timer(self) -> None:
+        """Cancel the timer for the clients expiry."""
+
+        if self._expiry_cancel is not None:
+            self._expiry_cancel()
+        self._expiry_cancel = None
+        self._expiry_time = None
+
+    async def _async_expire_clients(self, now: datetime) -> None:
+        """Mark the expired clients as disconnected."""
+
+        self._expiry_cancel = None
+        self._expiry_time = None
+
+        changed = self._expire_clients(now)
+
+        self._schedule_expiry_timer()
+        self._fire_clients_changed()
 
-        # Update latest connected sensors
-        self.update_latest_connected()
+        if not changed:
+            return
+
+        self._save_clients()
 
+        self._count_clients(changed)
+        nodes = self._update_nodes_load(changed)
+        self._send_signals(
+            [self.signal_client_update(mac) for mac in sorted(changed)]
+            + [self.signal_node_update(node) for node in sorted(nodes)]
+        )
         await self._update_unpolled_sensors()
 
-    def update_latest_connected(self) -> None:
-        """Update latest connected sensors."""
+    def _expire_clients(self, now: datetime) -> set[str]:
+        """Mark the clients expired by `now` as disconnected.
 
-        def latest_connected_time(self, element: dict[str, Any]) -> datetime:
-            """Get connected time for the device."""
+        Returns the clients which have changed.
+        """
 
-            connected = element.get("connected")
-            if isinstance(connected, datetime):
-                return connected
-            # If not connected, return the current time
-            # This is just a fallback, since the device should be connected
-            return datetime.now(UTC)
+        changed = set()
+        for mac in self._expiry.pop_expired(now):
+            client = self._clients.get(mac) or self._hidden_clients.get(mac)
+            if client is not None and client.expire(
+                event_call=self.fire_event
+            ):
+                changed.add(mac)
+        return changed
+
+    def _update_nodes_load(self, macs: set[str]) -> set[str]:
+        """Update the AiMesh nodes load and return the changed nodes.
+
+        Roaming of the clients is checked at the same time.
+        """
+
+        now = datetime.now(UTC)
+        nodes: set[str] = set()
+        for mac in macs:
+            client = self._clients.get(mac) or self._hidden_clients.get(mac)
+            nodes |= self._nodes_load.update(mac, client)
+
+            roam = self._roaming.update(mac, client, now)
+            if roam is not None:
+                _LOGGER.debug("Client roamed: %s", roam)
+                self.fire_event(CONF_EVENT_DEVICE_ROAMED, roam)
+        return nodes
+
+    def node_load(self, mac: str) -> ARNodeLoad:
+        """Return the connected clients of the AiMesh node."""
+
+        return self._nodes_load.get(mac)
+
+    def _count_clients(self, macs: Iterable[str]) -> None:
+        """Count the connected clients with the changed ones."""
+
+        for mac in macs:
+            client = self._clients.get(mac) or self._hidden_clients.get(mac)
+            if client is not None and client.state:
+                self._connected_clients.add(mac)
+            else:
+                self._connected_clients.discard(mac)
+            if client is not None and client.guest:
+                self._guest_clients.add(mac)
+            else:
+                self._guest_clients.discard(mac)
 
-        # New list
-        # We take all the clients currently connected from the
-        # self._clients_list which have the connected time set
-        new_list = [
-            client for client in self._clients_list if client.get("connected")
+        # Connected clients sensor
+        self._clients_number = len(self._connected_clients)
+        self._clients_list = [
+            (self._clients.get(mac) or self._hidden_clients[mac]).identity
+            for mac in sorted(self._connected_clients)
         ]
 
-        # Append any client which was already in the list
-        # self._latest_connected_list but is not in the new list.
-        # This means that the client has disconnected, but the sensor
-        # should be showing all the connections made. Since client
-        # itself might have changed, we should compare MAC addresses
-        for client in self._latest_connected_list:
-            if client["mac"] not in [x["mac"] for x in new_list]:
-                new_list.append(client)
-
-        # Sort the list by time using the latest_connected_time function
-        # Newer devices should be at the end of the list
-        new_list.sort(key=lambda x: latest_connected_time(self, x))
-
-        # Reduce the list to the size specified in the configuration
-        while len(new_list) > self._options.get(
-            CONF_LATEST_CONNECTED, CONF_DEFAULT_LATEST_CONNECTED
-        ):
-            new_list.pop(0)
+        # Connected GuestNetwork clients sensor
+        self._gn_clients_number = len(self._guest_clients)
+
+    def update_latest_connected(self, macs: set[str]) -> None:
+        """Update latest connected sensors with the changed clients."""
+
+        changed = False
+        for mac in macs:
+            client = self._clients.get(mac) or self._hidden_clients.get(mac)
+            if client is not None and client.state:
+                changed |= self._latest_clients.update(client.identity)
 
-        # Update the self._latest_connected and self._latest_connected_list
-        # Check that list has at least one element so that we
-        # don't get an error
-        if len(new_list) > 0:
-            self._latest_connected = new_list[-1].get(CONNECTED)
-            self._latest_connected_list = new_list
+        if changed:
+            self._latest_connected_list = self._latest_clients.clients
+            self._latest_connected = self._latest_connected_list[-1].get(
+                CONNECTED
+            )
 
     async def update_nodes(self) -> None:
         """Update AsusRouter AiMesh nodes."""
 
+        aimesh = await self._async_get_nodes()
+        if aimesh is not None:
+            self._send_signals(self._apply_nodes(aimesh))
+
+    async def _async_get_nodes(self) -> dict[str, AiMeshDevice] | None:
+        """Get AsusRouter AiMesh nodes."""
+
         _LOGGER.debug("Updating AiMesh status for '%s'", self._conf_host)
         try:
             aimesh = await self.bridge.async_get_aimesh_nodes()
@@ -685,7 +1250,12 @@ class ARDevice:
                     self._conf_host,
                     ex,
                 )
-            return
+            return None
+
+        return aimesh
+
+    def _apply_nodes(self, aimesh: dict[str, AiMeshDevice]) -> list[str]:
+        """Apply the new AiMesh data and return the signals to send."""
 
         new_node = False
 
@@ -727,13 +1297,21 @@ class ARDevice:
                 self._aimesh_number += 1
             self._aimesh_list.append(node.identity)
 
-        async_dispatcher_send(self.hass, self.signal_aimesh_update)
+        signals = [self.signal_aimesh_update]
         if new_node:
-            async_dispatcher_send(self.hass, self.signal_aimesh_new)
+            signals.append(self.signal_aimesh_new)
+        return signals
 
     async def update_pc_rules(self) -> None:
         """Update parental control rules."""
 
+        pc_data = await self._async_get_pc_rules()
+        if pc_data is not None:
+            self._send_signals(self._apply_pc_rules(pc_data))
+
+    async def _async_get_pc_rules(self) -> dict[str, Any] | None:
+        """Get parental control rules."""
+
         _LOGGER.debug(
             "Updating parental control rules for '%s'", self._conf_host
         )
@@ -749,11 +1327,17 @@ class ARDevice:
                     self._conf_host,
                     ex,
                 )
-            return
+            return None
+
+        return pc_data
+
+    def _apply_pc_rules(self, pc_data: dict[str, Any]) -> list[str]:
+        """Apply the new parental control data and return the signals."""
 
         new_flag = False
 
-        rules: dict[str, ParentalControlRule] = pc_data.get("rules", {})
+        # Copy the rules, since the data can be shared with other callers
+        rules: dict[str, ParentalControlRule] = dict(pc_data.get("rules", {}))
 
         rules_to_save = {}
 
@@ -781,9 +1365,10 @@ class ARDevice:
         # Save rules
         self._pc_rules = rules_to_save
 
-        async_dispatcher_send(self.hass, self.signal_pc_rules_update)
+        signals = [self.signal_pc_rules_update]
         if new_flag:
-            async_dispatcher_send(self.hass, self.signal_pc_rules_new)
+            signals.append(self.signal_pc_rules_new)
+        return signals
 
     async def _init_services(self) -> None:
         """Initialize AsusRouter services."""
@@ -850,7 +1435,7 @@ class ARDevice:
         )
 
         # Get available sensors
-        available_sensors = await self.bridge.async_get_available_sensors()
+        available_sensors = await self._async_get_available_sensors()
 
         # Add devices sensors
         if self._mode in (ACCESS_POINT, MEDIA_BRIDGE, ROUTER):
@@ -858,6 +1443,7 @@ class ARDevice:
             available_sensors[AIMESH] = {SENSORS: SENSORS_AIMESH}
 
         # Process available sensors
+        coordinators: dict[str, DataUpdateCoordinator] = {}
         for sensor_type, sensor_definition in available_sensors.items():
             sensor_names = sensor_definition.get(SENSORS)
             if not sensor_names:
@@ -867,6 +1453,7 @@ class ARDevice:
             coordinator = await self._sensor_handler.get_coordinator(
                 sensor_type, sensor_definition.get(METHOD)
             )
+            coordinators[sensor_type] = coordinator
 
             # Save the coordinator
             self._sensor_coordinator[sensor_type] = {
@@ -874,6 +1461,98 @@ class ARDevice:
                 sensor_type: sensor_names,
             }
 
+        # Update coordinators
+        await self._sensor_handler.async_first_refresh(coordinators)
+
+        # Start polling
+        self._sensor_handler.scheduler.async_start()
+        self.async_on_close(self._sensor_handler.scheduler.async_stop)
+
+    async def _async_get_available_sensors(self) -> dict[str, dict[str, Any]]:
+        """Get available sensors.
+
+        The discovered sensors are cached for the current model and firmware.
+        On a cache hit, the discovery is skipped during the setup and
+        revalidated in the background once Home Assistant has started.
+        """
+
+        cache_key = self.bridge.cache_key
+        cache = await self._sensors_store.async_load()
+
+        if (
+            cache is not None
+            and cache_key is not None
+            and cache.get(STORAGE_CACHE_KEY) == cache_key
+        ):
+            _LOGGER.debug("Using cached sensors for `%s`", cache_key)
+            cached: dict[str, list[str]] = cache[STORAGE_SENSORS]
+
+            @callback
+            def _async_revalidate(hass: HomeAssistant) -> None:
+                """Revalidate the cached sensors."""
+
+                task = hass.async_create_background_task(
+                    self._async_revalidate_sensors(cached),
+                    name=f"{DOMAIN}_revalidate_sensors",
+                )
+                self.async_on_close(task.cancel)
+
+            self.async_on_close(async_at_started(self.hass, _async_revalidate))
+
+            return await self.bridge.async_get_available_sensors(cached)
+
+        discovered = await self.bridge.async_discover_sensors()
+        await self._async_save_sensors(discovered)
+
+        return await self.bridge.async_get_available_sensors(discovered)
+
+    async def _async_revalidate_sensors(
+        self,
+        cached: dict[str, list[str]],
+    ) -> None:
+        """Discover sensors again and reload if they have changed.
+
+        If any group cannot be discovered, the cache is kept as is,
+        since the defaults of that group do not mean that the sensors
+        have changed.
+        """
+
+        try:
+            discovered = await self.bridge.async_discover_sensors(strict=True)
+        except AsusRouterError as ex:
+            _LOGGER.debug("Cannot revalidate cached sensors: %s", ex)
+            return
+
+        if discovered == cached:
+            _LOGGER.debug("Cached sensors are up to date")
+            return
+
+        _LOGGER.info(
+            "Available sensors for '%s' have changed. Reloading",
+            self._conf_host,
+        )
+        await self._async_save_sensors(discovered)
+        self.hass.config_entries.async_schedule_reload(
+            self._config_entry.entry_id
+        )
+
+    async def _async_save_sensors(
+        self,
+        discovered: dict[str, list[str]],
+    ) -> None:
+        """Save discovered sensors to the cache."""
+
+        cache_key = self.bridge.cache_key
+        if cache_key is None:
+            return
+
+        await self._sensors_store.async_save(
+            {
+                STORAGE_CACHE_KEY: cache_key,
+                STORAGE_SENSORS: discovered,
+            }
+        )
+
     async def _update_unpolled_sensors(self) -> None:
         """Request refresh for AsusRouter unpolled sensors."""
 
@@ -921,6 +1600,10 @@ class ARDevice:
 
         self._on_close.clear()
 
+        # Write the pending clients state
+        if self._clients_save_pending:
+            await self._clients_store.async_save(self._clients_snapshot())
+
     @callback
     def async_on_close(
         self,
@@ -953,31 +1636,76 @@ class ARDevice:
         event: str,
         args: dict[str, Any] | None = None,
     ):
-        """Fire HA event."""
+        """Fire HA event.
+
+        Events of a single device are rate-limited per MAC. Client
+        connections and disconnections are limited together and the
+        latest suppressed state is fired with the next update after
+        the limit. They are also collected for the `clients_changed`
+        event.
+        """
 
         # Check for mute
         _event_mac = args.get("mac") if isinstance(args, dict) else None
+        if _event_mac is not None and not self._client_filter.allows(
+            _event_mac
+        ):
+            return
+
+        # Collect for the batched event
+        state: bool | None = None
         if _event_mac is not None:
-            match self._client_filter:
-                case "include":
-                    if _event_mac not in self._client_filter_list:
-                        return
-                case "exclude":
-                    if _event_mac in self._client_filter_list:
-                        return
-
-        _event_status = self._options.get(event)
-        if _event_status is None:
-            _event_status = CONF_DEFAULT_EVENT.get(event, False)
-        if _event_status is True:
-            event_name = f"{DOMAIN}_{event}"
+            if event in (
+                CONF_EVENT_DEVICE_CONNECTED,
+                CONF_EVENT_DEVICE_RECONNECTED,
+            ):
+                state = True
+                self._client_events.connected(_event_mac)
+            elif event == CONF_EVENT_DEVICE_DISCONNECTED:
+                state = False
+                self._client_events.disconnected(_event_mac)
+
+        if event not in self._events_enabled:
+            return
+
+        if _event_mac is not None and not self._client_events.allow(
+            event, _event_mac, time.monotonic(), state, args
+        ):
             _LOGGER.debug(
-                "Firing event `%s` with arguments: %s", event_name, args
-            )
-            self.hass.bus.fire(
-                event_name,
-                args,
+                "Event `%s` for %s is rate-limited", event, _event_mac
             )
+            return
+
+        self._fire_bus_event(event, args)
+
+    def _fire_bus_event(
+        self,
+        event: str,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Fire the event on the HA bus."""
+
+        event_name = f"{DOMAIN}_{event}"
+        _LOGGER.debug("Firing event `%s` with arguments: %s", event_name, args)
+        self.hass.bus.fire(
+            event_name,
+            args,
+        )
+
+    def _fire_clients_changed(self) -> None:
+        """Fire a single event with the clients changed since the last one."""
+
+        now = time.monotonic()
+
+        # Latest state of the clients which were rate-limited
+        for event, args in self._client_events.pop_due(now):
+            self._fire_bus_event(event, args)
+
+        changes = self._client_events.flush(now)
+        if changes is not None and (
+            CONF_EVENT_CLIENTS_CHANGED in self._events_enabled
+        ):
+            self.fire_event(CONF_EVENT_CLIENTS_CHANGED, changes)
 
     async def remove_trackers(self, **kwargs: Any) -> None:
         """Remove device trackers."""
@@ -991,6 +1719,8 @@ class ARDevice:
 
         # Get entities to remove
         if "entities" in raw:
+            removed: list[str] = []
+            nodes: set[str] = set()
             entities = raw["entities"]
             entity_reg = er.async_get(self.hass)
             for entity in entities:
@@ -1001,8 +1731,14 @@ class ARDevice:
                 mac = capabilities[MAC]
                 _LOGGER.debug("Trying to remove tracker with mac: %s", mac)
                 if mac in self._clients:
-                    self._clients.pop(mac)
+                    nodes |= self._remove_client(mac)
+                    removed.append(mac)
                     _LOGGER.debug("Found and removed")
+            self._count_clients(removed)
+            self._save_clients()
+            self._send_signals(
+                [self.signal_node_update(node) for node in sorted(nodes)]
+            )
 
         # Update clients
         await self.update_clients()
@@ -1031,41 +1767,78 @@ class ARDevice:
             sw_version=self.bridge.sw_version,
         )
 
+    @property
+    def refresh_time(self) -> dict[str, float]:
+        """Return time spent on the first refresh of each coordinator."""
+
+        if not self._sensor_handler:
+            return {}
+
+        return self._sensor_handler.refresh_time
+
+    @property
+    def clients_stats(self) -> dict[str, Any]:
+        """Return the number of stored and removed clients."""
+
+        return {
+            "tracked": len(self._clients),
+            "hidden": len(self._hidden_clients),
+            "evicted": self._evicted_clients,
+            "roams": self._roaming.total,
+            "limit": self._clients_limit,
+            "max_age_days": (
+                self._clients_max_age.days if self._clients_max_age else 0
+            ),
+        }
+
+    @property
+    def intervals(self) -> dict[str, float]:
+        """Return the current update intervals of the sensor groups."""
+
+        if not self._sensor_handler:
+            return {}
+
+        return self._sensor_handler.scheduler.intervals
+
     @property
     def signal_aimesh_new(self) -> str:
         """Notify new AiMesh nodes."""
 
-        return f"{DOMAIN}-aimesh-new"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-aimesh-new"
 
     @property
     def signal_aimesh_update(self) -> str:
         """Notify updated AiMesh nodes."""
 
-        return f"{DOMAIN}-aimesh-update"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-aimesh-update"
 
     @property
     def signal_device_new(self) -> str:
         """Notify new device."""
 
-        return f"{DOMAIN}-device-new"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-device-new"
 
-    @property
-    def signal_device_update(self) -> str:
-        """Notify updated device."""
+    def signal_client_update(self, mac: str) -> str:
+        """Notify updated client."""
+
+        return f"{DOMAIN}-{self._config_entry.entry_id}-device-update-{mac}"
+
+    def signal_node_update(self, mac: str) -> str:
+        """Notify updated clients of the AiMesh node."""
 
-        return f"{DOMAIN}-device-update"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-aimesh-clients-{mac}"
 
     @property
     def signal_pc_rules_new(self) -> str:
         """Notify new parental control rules."""
 
-        return f"{DOMAIN}-pc-rules-new"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-pc-rules-new"
 
     @property
     def signal_pc_rules_update(self) -> str:
         """Notify updated parental control rules."""
 
-        return f"{DOMAIN}-pc-rules-update"
+        return f"{DOMAIN}-{self._config_entry.entry_id}-pc-rules-update"
 
     @property
     def aimesh(self) -> dict[str, Any]:
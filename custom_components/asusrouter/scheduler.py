@@ -0,0 +1,196 @@
+"""AsusRouter scheduler module."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import random
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, SCHEDULER_BATCH_WINDOW, SCHEDULER_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _has_listeners(coordinator: DataUpdateCoordinator) -> bool:
+    """Check whether any entity listens to the coordinator.
+
+    `async_contexts` cannot be used, since it skips the listeners
+    without a context, like the coordinator entities.
+    """
+
+    return bool(coordinator._listeners)  # noqa: SLF001
+
+
+@dataclass
+class ARPollGroup:
+    """Polled group of sensors."""
+
+    coordinator: DataUpdateCoordinator
+    interval: timedelta
+    next_due: float = 0.0
+    in_flight: bool = False
+
+
+class ARPollScheduler:
+    """Poll scheduler for all the sensor groups of a router.
+
+    Instead of a separate timer for each coordinator, a single timer
+    wakes up when the next group is due. All the groups due at that
+    moment are refreshed as one batch with a limited number of
+    refreshes in flight.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_in_flight: int,
+    ) -> None:
+        """Initialize the scheduler."""
+
+        self.hass = hass
+
+        self._limit = asyncio.Semaphore(max(1, max_in_flight))
+        self._groups: dict[str, ARPollGroup] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._started: bool = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    def add(
+        self,
+        name: str,
+        coordinator: DataUpdateCoordinator,
+        interval: timedelta,
+    ) -> None:
+        """Add a group to the scheduler."""
+
+        self._groups[name] = ARPollGroup(
+            coordinator=coordinator,
+            interval=interval,
+            next_due=self.hass.loop.time() + interval.total_seconds(),
+        )
+
+    def get_interval(self, name: str) -> timedelta | None:
+        """Get the current interval of a group."""
+
+        group = self._groups.get(name)
+        return group.interval if group is not None else None
+
+    @callback
+    def set_interval(self, name: str, interval: timedelta) -> None:
+        """Change the interval of a group."""
+
+        group = self._groups.get(name)
+        if group is None or group.interval == interval:
+            return
+
+        # Move the next poll relative to the previous one
+        group.next_due += (interval - group.interval).total_seconds()
+        group.interval = interval
+
+        self._schedule()
+
+    @property
+    def intervals(self) -> dict[str, float]:
+        """Return the current intervals of all the groups in seconds."""
+
+        return {
+            name: group.interval.total_seconds()
+            for name, group in self._groups.items()
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling."""
+
+        self._started = True
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling."""
+
+        self._started = False
+
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    @callback
+    def _schedule(self) -> None:
+        """Schedule the next batch."""
+
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+        if not self._started or not self._groups:
+            return
+
+        next_due = min(group.next_due for group in self._groups.values())
+        jitter = random.uniform(0, SCHEDULER_JITTER)  # noqa: S311
+        delay = max(0.0, next_due - self.hass.loop.time()) + jitter
+
+        self._unsub = async_call_later(self.hass, delay, self._async_tick)
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Plan and start the batch of groups which are due."""
+
+        self._unsub = None
+        now = self.hass.loop.time()
+
+        batch: list[str] = []
+        for name, group in self._groups.items():
+            if group.next_due > now + SCHEDULER_BATCH_WINDOW:
+                continue
+
+            # Keep the groups on their own schedule, unless
+            # they are falling behind it
+            interval = group.interval.total_seconds()
+            group.next_due = max(group.next_due + interval, now + interval)
+
+            # Skip this round if the previous refresh is not finished yet
+            # or no entity is listening to the group
+            if group.in_flight or not _has_listeners(group.coordinator):
+                continue
+
+            batch.append(name)
+
+        if batch:
+            _LOGGER.debug("Polling groups: %s", batch)
+            task = self.hass.async_create_background_task(
+                self._async_refresh(batch),
+                name=f"{DOMAIN}_poll",
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        self._schedule()
+
+    async def _async_refresh(self, batch: list[str]) -> None:
+        """Refresh a batch of groups."""
+
+        await asyncio.gather(
+            *(self._async_refresh_group(name) for name in batch)
+        )
+
+    async def _async_refresh_group(self, name: str) -> None:
+        """Refresh a single group."""
+
+        group = self._groups[name]
+        group.in_flight = True
+        try:
+            async with self._limit:
+                await group.coordinator.async_refresh()
+        finally:
+            group.in_flight = False
@@ -4,17 +4,32 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .compilers import list_sensors_network
-from .const import CONF_INTERFACES, STATIC_SENSORS
+from .const import (
+    AIMESH,
+    ASUSROUTER,
+    CONF_INTERFACES,
+    DOMAIN,
+    ICON_DEVICES,
+    STATIC_SENSORS,
+)
 from .dataclass import ARSensorDescription
 from .entity import AREntity, async_setup_ar_entry
-from .router import ARDevice
+from .helpers import to_unique_id
+from .router import AiMeshNode, ARDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +58,21 @@ async def async_setup_entry(
         hass, config_entry, async_add_entities, sensors, ARSensor
     )
 
+    router = hass.data[DOMAIN][config_entry.entry_id][ASUSROUTER]
+    tracked: set = set()
+
+    @callback
+    def update_router():
+        """Update the values of the router."""
+
+        add_entities(router, async_add_entities, tracked)
+
+    router.async_on_close(
+        async_dispatcher_connect(hass, router.signal_aimesh_new, update_router)
+    )
+
+    update_router()
+
 
 class ARSensor(AREntity, SensorEntity):
     """AsusRouter sensor."""
@@ -66,3 +96,102 @@ class ARSensor(AREntity, SensorEntity):
 
         description = self.entity_description
         return self.coordinator.data.get(description.key)
+
+
+@callback
+def add_entities(
+    router: ARDevice,
+    async_add_entities: AddEntitiesCallback,
+    tracked: set[str],
+) -> None:
+    """Add new AiMesh node sensors from the router."""
+
+    new_tracked: list[SensorEntity] = []
+
+    for mac, node in router.aimesh.items():
+        if mac in tracked:
+            continue
+
+        new_tracked.append(AMClientsSensor(router, node))
+        new_tracked.append(AMRssiSensor(router, node))
+        tracked.add(mac)
+
+    if new_tracked:
+        async_add_entities(new_tracked)
+
+
+class AMClientsSensor(SensorEntity):
+    """AsusRouter AiMesh node clients sensor."""
+
+    _attr_should_poll = False
+    _attr_icon = ICON_DEVICES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _suffix = "clients"
+
+    def __init__(
+        self,
+        router: ARDevice,
+        node: AiMeshNode,
+    ) -> None:
+        """Initialize AsusRouter AiMesh node sensor."""
+
+        self._router = router
+        self._node = node
+        self._attr_unique_id = to_unique_id(
+            f"{router.mac}_{AIMESH}_{node.mac}_{self._suffix}"
+        )
+        self._attr_name = (
+            f"AiMesh {node.native.model} ({node.native.mac}) {self._suffix}"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the number of connected clients."""
+
+        return self._router.node_load(self._node.mac).clients
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the number of clients for each connection type."""
+
+        return dict(
+            sorted(self._router.node_load(self._node.mac).bands.items())
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+
+        return self._node.device_info(self._router.mac)
+
+    async def async_added_to_hass(self) -> None:
+        """Register state update callback."""
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self._router.signal_node_update(self._node.mac),
+                self.async_write_ha_state,
+            )
+        )
+
+
+class AMRssiSensor(AMClientsSensor):
+    """AsusRouter AiMesh node average RSSI sensor."""
+
+    _attr_icon = None
+    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+    _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+    _suffix = "rssi"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average RSSI of the wireless clients."""
+
+        return self._router.node_load(self._node.mac).rssi
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the number of clients with the reported RSSI."""
+
+        return {"clients": self._router.node_load(self._node.mac).rssi_clients}
@@ -0,0 +1,27 @@
+"""AsusRouter storage module."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGES
+
+
+def get_store(
+    hass: HomeAssistant,
+    entry_id: str,
+    name: str,
+) -> Store[dict[str, Any]]:
+    """Get a store for the config entry."""
+
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{name}")
+
+
+async def async_remove_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove all the stores of the config entry."""
+
+    for name in STORAGES:
+        await get_store(hass, entry_id, name).async_remove()
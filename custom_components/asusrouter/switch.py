@@ -212,7 +212,7 @@ class ClientInternetSwitch(SwitchEntity):
 
         try:
             _LOGGER.debug("Changing PC rule to %s", state)
-            result = await self._router.bridge.api.async_set_state(
+            result = await self._router.bridge.async_set_state(
                 state=state, **kwargs
             )
             self._rule = state
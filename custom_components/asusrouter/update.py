@@ -78,7 +78,7 @@ class ARUpdate(ARBinaryEntity, UpdateEntity):
                 "Trying to install Firmware update. "
                 "This might take several minutes."
             )
-            result = await self.api.async_set_state(
+            result = await self.router.bridge.async_set_state(
                 state=AsusSystem.FIRMWARE_UPGRADE,
             )
             if not result:
@@ -0,0 +1,378 @@
+"""Tests for the bridge module / Part 01 / Sensors."""
+
+import asyncio
+from functools import partial
+from typing import Any
+from unittest.mock import AsyncMock, Mock, call, patch
+
+from asusrouter.error import (
+    AsusRouterConnectionError,
+    AsusRouterError,
+    AsusRouterTimeoutError,
+)
+from asusrouter.modules.data import AsusData
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_USERNAME,
+)
+import pytest
+
+from custom_components.asusrouter import bridge as bridge_module
+from custom_components.asusrouter.bridge import ARBridge
+from custom_components.asusrouter.const import (
+    BREAKER_THRESHOLD,
+    CONF_MAX_REQUESTS,
+    CONF_STALE_DATA,
+    CPU,
+    DEFAULT_SENSORS,
+    METHOD,
+    RAM,
+    SENSORS,
+    SENSORS_RAM,
+)
+from tests.helpers import AsyncPatch, SyncPatch
+
+FAKE_CONFIGS: dict[str, Any] = {
+    CONF_HOST: "hostname",
+    CONF_USERNAME: "username",
+    CONF_PASSWORD: "password",
+    CONF_SSL: True,
+    CONF_PORT: 8443,
+}
+
+
+@pytest.mark.asyncio
+async def test_discover_sensors(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test the sensors discovery."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    with patch.object(ARBridge, "_get_api"):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    with (
+        patch.object(
+            ARBridge,
+            "_get_sensors_modern",
+            AsyncMock(return_value=["sensor"]),
+        ),
+        patch.object(
+            ARBridge, "_get_sensors", AsyncMock(return_value=["port"])
+        ),
+    ):
+        sensors = await bridge.async_get_available_sensors()
+
+    assert sensors[CPU][SENSORS] == ["sensor"]
+    assert sensors[RAM][SENSORS] == SENSORS_RAM
+    assert callable(sensors[CPU][METHOD])
+    assert set(bridge.discovery_time) <= set(sensors)
+    assert CPU in bridge.discovery_time
+
+
+@pytest.mark.asyncio
+async def test_requests_limit(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that the number of simultaneous requests is limited."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    limit = 2
+    active = 0
+    peak = 0
+
+    async def mock_get_data(datatype: AsusData, force: bool = False) -> Any:
+        """Mock the API request."""
+
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return {}
+
+    api = Mock()
+    api.async_get_data = mock_get_data
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {CONF_MAX_REQUESTS: limit})
+
+    await bridge.async_discover_sensors()
+
+    assert 0 < peak <= limit
+
+
+@pytest.mark.asyncio
+async def test_discover_sensors_strict(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that a strict discovery does not hide the errors."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    api = Mock()
+    api.async_get_data = AsyncMock(side_effect=AsusRouterTimeoutError())
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    # The defaults are used
+    sensors = await bridge.async_discover_sensors()
+    assert sensors[CPU] == DEFAULT_SENSORS[CPU]
+
+    # The error is raised
+    with pytest.raises(AsusRouterError):
+        await bridge.async_discover_sensors(strict=True)
+
+
+@pytest.mark.asyncio
+async def test_requests_coalescing(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that concurrent requests for the same data are shared."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    calls: list[tuple[AsusData, bool]] = []
+
+    async def mock_get_data(datatype: AsusData, force: bool = False) -> Any:
+        """Mock the API request."""
+
+        calls.append((datatype, force))
+        await asyncio.sleep(0)
+        return {"value": len(calls)}
+
+    api = Mock()
+    api.async_get_data = mock_get_data
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    results = await asyncio.gather(
+        bridge._async_get_raw(AsusData.CPU),
+        bridge._async_get_raw(AsusData.CPU),
+        bridge._async_get_raw(AsusData.RAM),
+    )
+
+    assert calls == [(AsusData.CPU, False), (AsusData.RAM, False)]
+    assert results[0] is results[1]
+
+    # A forced request does not join a non-forced one
+    calls.clear()
+    await asyncio.gather(
+        bridge._async_get_raw(AsusData.CPU),
+        bridge._async_get_raw(AsusData.CPU, force=True),
+    )
+
+    assert calls == [(AsusData.CPU, False), (AsusData.CPU, True)]
+    assert not bridge._in_flight
+
+
+@pytest.mark.asyncio
+async def test_cache_times(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that slow-changing data is cached by the bridge."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    api = Mock()
+    api.async_get_data = AsyncMock(return_value={"value": 1})
+    api.async_set_state = AsyncMock(return_value=True)
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    # Cached data
+    await bridge._async_get_raw(AsusData.FIRMWARE)
+    await bridge._async_get_raw(AsusData.FIRMWARE)
+    api.async_get_data.assert_awaited_once()
+
+    # Not cached data
+    api.async_get_data.reset_mock()
+    await bridge._async_get_raw(AsusData.CPU)
+    await bridge._async_get_raw(AsusData.CPU)
+    assert (
+        api.async_get_data.await_args_list
+        == [call(AsusData.CPU, force=False)] * 2
+    )
+
+    # Forced request bypasses the cache
+    api.async_get_data.reset_mock()
+    await bridge._async_get_raw(AsusData.FIRMWARE, force=True)
+    api.async_get_data.assert_awaited_once()
+
+    # State change drops the cache
+    api.async_get_data.reset_mock()
+    await bridge.async_set_state(Mock())
+    await bridge._async_get_raw(AsusData.FIRMWARE)
+    api.async_get_data.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_data(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that the latest data is served while being revalidated."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    api = Mock()
+    api.async_get_data = AsyncMock(return_value={"value": 1})
+
+    hass = Mock()
+    hass.async_create_background_task = (
+        lambda target, name: asyncio.get_running_loop().create_task(target)
+    )
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(hass, FAKE_CONFIGS, {CONF_STALE_DATA: True})
+
+    method = partial(bridge._get_data, AsusData.CPU)
+    listener = Mock()
+
+    # No data yet
+    assert await bridge.async_get_data(method, listener) == {"value": 1}
+
+    # The latest data is returned and revalidated in the background
+    api.async_get_data.return_value = {"value": 2}
+    assert await bridge.async_get_data(method, listener) == {"value": 1}
+    await asyncio.gather(*bridge._revalidating.values())
+    listener.assert_called_once_with({"value": 2})
+    assert await bridge.async_get_data(method, listener) == {"value": 2}
+    await asyncio.gather(*bridge._revalidating.values())
+
+    # Callers without a listener get the fresh data
+    api.async_get_data.return_value = {"value": 3}
+    assert await bridge._get_data(AsusData.CPU) == {"value": 3}
+    assert not bridge._revalidating
+
+
+def test_process_payload(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that only the changed payloads are processed."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    with patch.object(ARBridge, "_get_api"):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    process = Mock(side_effect=lambda raw: {"value": raw["value"]})
+    process_total = Mock(side_effect=lambda raw: {"total": raw["value"]})
+
+    # Unchanged payload is not processed again
+    data = bridge._process_payload(AsusData.CPU, {"value": 1}, process)
+    assert bridge._process_payload(AsusData.CPU, {"value": 1}, process) is data
+    process.assert_called_once()
+
+    # Changed payload is processed
+    assert bridge._process_payload(AsusData.CPU, {"value": 2}, process) == {
+        "value": 2
+    }
+    assert process.call_args_list == [call({"value": 1}), call({"value": 2})]
+
+    # Another processing of the same datatype has its own cache
+    assert bridge._process_payload(
+        AsusData.CPU, {"value": 2}, process_total
+    ) == {"total": 2}
+    assert bridge._process_payload(AsusData.CPU, {"value": 2}, process) == {
+        "value": 2
+    }
+    process_total.assert_called_once()
+    assert process.call_args_list == [call({"value": 1}), call({"value": 2})]
+
+    # Payload updated in place by the library
+    raw = {"value": 3}
+    bridge._process_payload(AsusData.CPU, raw, process)
+    raw["value"] = 4
+    assert bridge._process_payload(AsusData.CPU, raw, process) == {"value": 4}
+
+
+@pytest.mark.asyncio
+async def test_set_state(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that the data is refreshed after the state is set."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    # The library keeps and updates the same payload
+    payload = {"state": False}
+
+    async def _set_state(state: Any, **kwargs: Any) -> bool:
+        payload["state"] = state
+        return True
+
+    api = Mock()
+    api.async_get_data = AsyncMock(return_value=payload)
+    api.async_set_state = _set_state
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    assert await bridge._get_data(AsusData.LED) == {"state": False}
+    assert await bridge.async_set_state(True) is True
+    assert not bridge._payloads
+    assert not bridge._payload_time
+    assert await bridge._get_data(AsusData.LED) == {"state": True}
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that requests to an unreachable device are paused."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    api = Mock()
+    api.async_get_data = AsyncMock(side_effect=AsusRouterTimeoutError())
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(Mock(), FAKE_CONFIGS, {})
+
+    # Open the breaker
+    for _ in range(BREAKER_THRESHOLD):
+        with pytest.raises(AsusRouterTimeoutError):
+            await bridge._async_get_raw(AsusData.CPU)
+
+    # No requests while the device is unreachable
+    api.async_get_data.reset_mock()
+    with pytest.raises(AsusRouterConnectionError):
+        await bridge._async_get_raw(AsusData.RAM)
+    api.async_get_data.assert_not_awaited()
+
+    # A single probe after the delay closes the breaker
+    bridge._unreachable_until = 0.0
+    api.async_get_data.side_effect = None
+    api.async_get_data.return_value = {}
+    await bridge._async_get_raw(AsusData.RAM)
+    await bridge._async_get_raw(AsusData.CPU)
+    assert [args.args[0] for args in api.async_get_data.await_args_list] == [
+        AsusData.RAM,
+        AsusData.CPU,
+    ]
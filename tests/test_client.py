@@ -0,0 +1,448 @@
+"""Tests for the client module."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+from asusrouter.modules.client import (
+    AsusClient,
+    AsusClientConnectionWlan,
+    AsusClientDescription,
+)
+from asusrouter.modules.connection import ConnectionState, ConnectionType
+import pytest
+
+from custom_components.asusrouter.client import (
+    ARClient,
+    ARClientChange,
+    ARClientFilter,
+    ARClientsDiff,
+    ARClientsEvents,
+    ARClientsExpiry,
+    ARClientsRoaming,
+    ARLatestClients,
+    ARNodesLoad,
+    select_stale_clients,
+)
+
+MAC = "00:11:22:33:44:55"
+RSSI = -70
+
+
+def _client(rssi: int = -50, ip_address: str = "192.168.1.2") -> AsusClient:
+    """Create a client reported by the device."""
+
+    return AsusClient(
+        state=ConnectionState.CONNECTED,
+        description=AsusClientDescription(name="Phone", mac=MAC),
+        connection=AsusClientConnectionWlan(
+            type=ConnectionType.WLAN_2G,
+            ip_address=ip_address,
+            rssi=rssi,
+        ),
+    )
+
+
+def test_update_changes() -> None:
+    """Test that only the actual changes are reported."""
+
+    client = ARClient(MAC)
+
+    # New client
+    assert client.update(_client()) is ARClientChange.IDENTITY
+    identity = client.identity
+    assert identity is not None
+    assert identity["ip"] == "192.168.1.2"
+
+    # Same data
+    assert client.update(_client()) is ARClientChange.NONE
+    assert client.identity is identity
+
+    # Attributes change only
+    assert client.update(_client(rssi=RSSI)) is ARClientChange.ATTRIBUTES
+    assert client.identity is identity
+    assert client.extra_state_attributes["rssi"] == RSSI
+
+    # Identity change
+    assert (
+        client.update(_client(ip_address="192.168.1.3"))
+        is ARClientChange.IDENTITY
+    )
+    assert client.identity is not identity
+
+
+def test_diff() -> None:
+    """Test the clients difference."""
+
+    assert not ARClientsDiff()
+    assert ARClientsDiff(changed={MAC})
+
+
+def test_compact() -> None:
+    """Test that the client does not keep the device data objects."""
+
+    client = ARClient(MAC)
+    client.update(_client())
+
+    assert not hasattr(client, "__dict__")
+    assert client.guest is False
+
+
+def test_lazy_views() -> None:
+    """Test that the views are only generated when requested."""
+
+    client = ARClient(MAC)
+    client.update(_client())
+    assert client._identity is None
+    assert client._extra_state_attributes is None
+
+    attributes = client.extra_state_attributes
+    assert attributes["mac"] == MAC
+    assert "vendor" not in attributes
+    assert client.identity is client._identity
+
+
+def test_latest_clients() -> None:
+    """Test the latest connected clients."""
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    latest = ARLatestClients(2)
+
+    def identity(index: int, minutes: int) -> dict:
+        """Create a client identity."""
+
+        return {
+            "mac": f"mac_{index}",
+            "connected": start + timedelta(minutes=minutes),
+        }
+
+    assert latest.update(identity(0, 1)) is True
+    assert latest.update(identity(1, 3)) is True
+    assert latest.update(identity(2, 2)) is True
+    assert latest.update(identity(3, 0)) is False
+    assert [client["mac"] for client in latest.clients] == ["mac_2", "mac_1"]
+
+    # Reconnected client
+    assert latest.update(identity(2, 4)) is True
+    assert [client["mac"] for client in latest.clients] == ["mac_1", "mac_2"]
+
+    # Without the connection time
+    assert latest.update({"mac": "mac_4"}) is False
+
+    # Removed client frees its place
+    assert latest.remove("mac_1") is True
+    assert latest.remove("mac_1") is False
+    assert latest.update(identity(3, 0)) is True
+    assert [client["mac"] for client in latest.clients] == ["mac_3", "mac_2"]
+
+
+def test_latest_clients_large() -> None:
+    """Test the latest connected clients with a large list of clients."""
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    capacity = 5
+    latest = ARLatestClients(capacity)
+
+    for index in range(10000):
+        latest.update(
+            {
+                "mac": f"mac_{index}",
+                # Shuffle the connection time
+                "connected": start + timedelta(seconds=(index * 7919) % 10000),
+            }
+        )
+
+    assert [client["connected"] for client in latest.clients] == [
+        start + timedelta(seconds=second) for second in range(9995, 10000)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("mac", "result"),
+    [
+        ("00:11:22:33:44:55", True),
+        ("aa:bb:cc:00:00:01", True),
+        ("0a:00:00:00:00:ff", True),
+        ("aa:bb:cd:00:00:01", False),
+        ("0a:00:00:00:00:fe", False),
+    ],
+)
+def test_client_filter(mac: str, result: bool) -> None:
+    """Test the clients filter."""
+
+    rules = ["AA-BB-CC", "a:*:*:*:*:ff", "", "invalid", "*"]
+
+    include = ARClientFilter("include", ["00:11:22:33:44:55"], rules)
+    exclude = ARClientFilter("exclude", ["00:11:22:33:44:55"], rules)
+    no_filter = ARClientFilter("no_filter", ["00:11:22:33:44:55"], rules)
+
+    assert include.allows(mac) is result
+    assert exclude.allows(mac) is not result
+    assert no_filter.allows(mac) is True
+
+
+def test_clients_expiry() -> None:
+    """Test the expiry of the clients."""
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    expiry = ARClientsExpiry()
+    assert expiry.next_expiry is None
+
+    expiry.schedule("mac_0", start + timedelta(seconds=10))
+    expiry.schedule("mac_1", start + timedelta(seconds=5.5))
+    expiry.schedule("mac_2", start + timedelta(seconds=6))
+    assert expiry.next_expiry == start + timedelta(seconds=6)
+
+    # Postponed expiry
+    expiry.schedule("mac_2", start + timedelta(seconds=20))
+    assert expiry.pop_expired(start + timedelta(seconds=6)) == {"mac_1"}
+    assert expiry.next_expiry == start + timedelta(seconds=10)
+
+    # Cancelled expiry
+    expiry.cancel("mac_0")
+    assert expiry.next_expiry == start + timedelta(seconds=20)
+    assert expiry.pop_expired(start + timedelta(seconds=30)) == {"mac_2"}
+    assert expiry.next_expiry is None
+
+
+def test_expire() -> None:
+    """Test that the connected client is marked as disconnected."""
+
+    client = ARClient(MAC)
+    event_call = Mock()
+
+    client.update(_client())
+    assert client.state is True
+
+    # Not reported by the device, but not expired yet
+    client.update(None)
+    assert client.state is True
+
+    assert client.expire(event_call) is True
+    assert client.state is False
+    event_call.assert_called_once_with("device_disconnected", client.identity)
+    assert client.expire(event_call) is False
+
+
+def test_snapshot() -> None:
+    """Test that the client state is restored from the snapshot."""
+
+    client = ARClient(MAC)
+    client.update(_client())
+    snapshot = client.snapshot()
+
+    restored = ARClient(MAC)
+    restored.restore(snapshot)
+    assert restored.state is True
+    assert restored.last_activity == client.last_activity
+    assert restored.identity == client.identity
+
+    # The same state does not fire any events
+    event_call = Mock()
+    assert (
+        restored.update(_client(), event_call) is not ARClientChange.IDENTITY
+    )
+    event_call.assert_not_called()
+
+    # Invalid snapshot
+    with pytest.raises(ValueError, match="online"):
+        ARClient(MAC).restore({"state": "online"})
+
+
+def test_clients_events() -> None:
+    """Test the batched and rate-limited client events."""
+
+    rate_limit = 60.0
+    events = ARClientsEvents(rate_limit)
+
+    # Nothing to report
+    assert events.flush(0.0) is None
+
+    # A single batch for many clients, the latest state wins
+    clients = 100
+    for index in range(clients):
+        events.connected(f"mac_{index}")
+    events.disconnected("mac_0")
+    events.disconnected("mac_100")
+    changes = events.flush(0.0)
+    assert changes is not None
+    assert len(changes["added"]) == clients - 1
+    assert changes["removed"] == ["mac_0", "mac_100"]
+    assert events.flush(0.0) is None
+
+    # Rate limit per client and event type
+    assert events.allow("device_reconnected", "mac_0", 0.0) is True
+    assert events.allow("device_reconnected", "mac_0", 1.0) is False
+    assert events.allow("device_disconnected", "mac_0", 1.0) is True
+    assert events.allow("device_reconnected", "mac_1", 1.0) is True
+    assert events.allow("device_reconnected", "mac_0", rate_limit) is True
+
+    # Connections and disconnections are limited together
+    assert events.allow("device_connected", "mac_2", 0.0, True) is True
+    assert events.allow("device_disconnected", "mac_2", 1.0, False) is False
+    assert events.allow("device_reconnected", "mac_2", 2.0, True) is False
+    assert events.pop_due(rate_limit) == []
+
+    # The latest suppressed state is fired after the limit
+    args = {"mac": "mac_2"}
+    allowed = events.allow("device_disconnected", "mac_2", 3.0, False, args)
+    assert allowed is False
+    assert events.pop_due(rate_limit - 1) == []
+    assert events.pop_due(rate_limit) == [("device_disconnected", args)]
+    assert events.pop_due(rate_limit) == []
+
+    # The fired state starts a new limit
+    allowed = events.allow("device_reconnected", "mac_2", rate_limit, True)
+    assert allowed is False
+    assert events.pop_due(3 * rate_limit) == [("device_reconnected", None)]
+
+    # Old limits are forgotten
+    events.flush(5 * rate_limit)
+    assert not events._fired
+
+
+def test_select_stale_clients() -> None:
+    """Test the selection of the stale clients."""
+
+    now = datetime(2024, 1, 10, tzinfo=UTC)
+
+    def client(days: int | None, connected: bool = False) -> ARClient:
+        """Create a client last seen `days` ago."""
+
+        client = Mock(spec=ARClient)
+        client.state = connected
+        client.last_activity = (
+            now - timedelta(days=days) if days is not None else None
+        )
+        return client
+
+    clients = {
+        "connected": client(30, connected=True),
+        "old": client(30),
+        "unknown": client(None),
+        "recent": client(1),
+        "new": client(0),
+    }
+
+    # No limits
+    assert select_stale_clients(clients, 0, None, now) == set()
+
+    # By age, the unknown age is kept
+    assert select_stale_clients(clients, 0, timedelta(days=7), now) == {"old"}
+
+    # By the number of clients, the least recently seen first
+    assert select_stale_clients(clients, 3, None, now) == {"old", "unknown"}
+    assert select_stale_clients(clients, 1, None, now) == {
+        "old",
+        "unknown",
+        "recent",
+        "new",
+    }
+
+    # Both
+    assert select_stale_clients(clients, 4, timedelta(days=7), now) == {"old"}
+
+
+def test_nodes_load() -> None:
+    """Test the connected clients of the AiMesh nodes."""
+
+    node_1 = "00:00:00:00:00:01"
+    node_2 = "00:00:00:00:00:02"
+    loads = ARNodesLoad()
+
+    def client(
+        node: str,
+        rssi: int | None,
+        connection_type: ConnectionType = ConnectionType.WLAN_2G,
+    ) -> ARClient:
+        """Create a connected client."""
+
+        client = Mock(spec=ARClient)
+        client.state = True
+        client.node = node
+        client.rssi = rssi
+        client.connection_type = connection_type
+        return client
+
+    assert loads.update("mac_1", client(node_1, -40)) == {node_1}
+    assert loads.update("mac_2", client(node_1, -60)) == {node_1}
+    assert loads.update(
+        "mac_3", client(node_1, None, ConnectionType.WIRED)
+    ) == {node_1}
+    load = loads.get(node_1)
+    assert load.clients == len(["mac_1", "mac_2", "mac_3"])
+    assert load.bands == {
+        ConnectionType.WLAN_2G.value: 2,
+        ConnectionType.WIRED.value: 1,
+    }
+    assert load.rssi == RSSI + 20
+
+    # Same data
+    assert loads.update("mac_1", client(node_1, -40)) == set()
+
+    # Roaming client
+    assert loads.update("mac_2", client(node_2, -60)) == {node_1, node_2}
+    assert loads.get(node_1).rssi == RSSI + 30
+    assert loads.get(node_2).clients == 1
+
+    # Disconnected client
+    assert loads.update("mac_2", None) == {node_2}
+    assert loads.get(node_2).clients == 0
+    assert loads.get(node_2).bands == {}
+    assert loads.get(node_2).rssi is None
+    assert loads.get("unknown").clients == 0
+
+
+def test_roaming() -> None:
+    """Test the roaming detection of the wireless clients."""
+
+    history = 2
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    roaming = ARClientsRoaming(history)
+
+    def client(
+        node: str, connection_type: ConnectionType = ConnectionType.WLAN_2G
+    ) -> ARClient:
+        """Create a connected client."""
+
+        client = Mock(spec=ARClient)
+        client.state = True
+        client.node = node
+        client.connection_type = connection_type
+        return client
+
+    # New and stationary client
+    assert roaming.update(MAC, client("node_1"), now) is None
+    assert roaming.update(MAC, client("node_1"), now) is None
+
+    # Roamed to another node, then to another band
+    assert roaming.update(MAC, client("node_2"), now) == {
+        "mac": MAC,
+        "from_node": "node_1",
+        "from_band": ConnectionType.WLAN_2G.value,
+        "to_node": "node_2",
+        "to_band": ConnectionType.WLAN_2G.value,
+        "roams": 1,
+    }
+    event = roaming.update(MAC, client("node_2", ConnectionType.WLAN_5G), now)
+    assert event is not None
+    assert event["to_band"] == ConnectionType.WLAN_5G.value
+
+    # Only the latest roams are kept
+    roaming.update(MAC, client("node_1", ConnectionType.WLAN_5G), now)
+    assert [roam.to_node for roam in roaming.roams(MAC)] == [
+        "node_2",
+        "node_1",
+    ]
+    assert roaming.total == history + 1
+
+    # Disconnected and wired clients do not roam
+    assert roaming.update(MAC, None, now) is None
+    assert roaming.update(MAC, client("node_2"), now) is None
+    assert (
+        roaming.update(MAC, client("node_1", ConnectionType.WIRED), now)
+        is None
+    )
+
+    roaming.remove(MAC)
+    assert roaming.roams(MAC) == []
+    assert roaming.total == 0
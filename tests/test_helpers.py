@@ -0,0 +1,71 @@
+"""Tests for the helpers module."""
+
+from typing import Any
+
+import pytest
+
+from custom_components.asusrouter.helpers import (
+    FlatLayout,
+    as_dict,
+    flatten_dict,
+)
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        {},
+        {"a": 1},
+        {"a": {"b": {"c": 1}, "d": 2}, "e": {}},
+        {"": {"x": 1}},
+        {1: {2: 3}},
+        5,
+    ],
+    ids=[
+        "empty",
+        "flat",
+        "nested",
+        "empty_key",
+        "non_string_keys",
+        "scalar",
+    ],
+)
+def test_flat_layout(sample: Any) -> None:
+    """Test that the layout flattens the same way as `flatten_dict`."""
+
+    expected = as_dict(flatten_dict(sample))
+    result = FlatLayout(sample).flatten(sample)
+
+    assert result == expected
+    assert list(result or {}) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": {"c": 1}},
+        {"a": {"b": {"x": 1}}},
+        {"a": 1},
+        {"a": {"b": 1, "c": 2}},
+        None,
+    ],
+    ids=[
+        "renamed_key",
+        "value_to_dict",
+        "dict_to_value",
+        "added_key",
+        "not_dict",
+    ],
+)
+def test_flat_layout_mismatch(obj: Any) -> None:
+    """Test that a different layout is detected."""
+
+    assert FlatLayout({"a": {"b": 1}}).flatten(obj) is None
+
+
+def test_flat_layout_values() -> None:
+    """Test that the new values are used with the same layout."""
+
+    layout = FlatLayout({"a": {"b": 1}, "c": 2})
+
+    assert layout.flatten({"a": {"b": 3}, "c": 4}) == {"a_b": 3, "c": 4}
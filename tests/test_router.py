@@ -0,0 +1,640 @@
+"""Tests for the router module."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from asusrouter.error import AsusRouterTimeoutError
+from asusrouter.modules.aimesh import AiMeshDevice
+from asusrouter.modules.client import (
+    AsusClient,
+    AsusClientConnectionWlan,
+    AsusClientDescription,
+)
+from asusrouter.modules.connection import ConnectionState, ConnectionType
+import attr
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_USERNAME,
+)
+from homeassistant.helpers import entity_registry as er
+import pytest
+
+from custom_components.asusrouter import (
+    bridge as bridge_module,
+    router as router_module,
+    sensor as sensor_module,
+)
+from custom_components.asusrouter.bridge import ARBridge
+from custom_components.asusrouter.client import ARClient
+from custom_components.asusrouter.const import (
+    CONF_ADAPTIVE_INTERVALS,
+    CONF_CLIENTS_LIMIT,
+    CONF_EVENT_CLIENTS_CHANGED,
+    CONF_EVENT_DEVICE_CONNECTED,
+    CONF_EVENT_DEVICE_DISCONNECTED,
+    CONF_EVENT_DEVICE_RECONNECTED,
+    CONF_LATEST_CONNECTED,
+    CONF_MAX_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_STALE_DATA,
+    CPU,
+    DOMAIN,
+    EVENT_RATE_LIMIT,
+    STORAGE_CLIENTS,
+)
+from custom_components.asusrouter.router import ARDevice, ARSensorHandler
+from custom_components.asusrouter.sensor import AMClientsSensor, AMRssiSensor
+from tests.helpers import AsyncPatch, SyncPatch
+
+FAKE_CONFIGS: dict[str, Any] = {
+    CONF_HOST: "hostname",
+    CONF_USERNAME: "username",
+    CONF_PASSWORD: "password",
+    CONF_PORT: 0,
+    CONF_SSL: False,
+}
+
+ROUTERS = 5
+FAKE_MAC = "00:11:22:33:44:55"
+NODE_MAC = "00:00:00:00:00:01"
+ROAM_MAC = "00:00:00:00:00:02"
+SINCE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _router(
+    hass: Any = None,
+    options: dict[str, Any] | None = None,
+    entry_id: str = "entry",
+) -> ARDevice:
+    """Create a router with the bridge and the stores mocked."""
+
+    config_entry = Mock(
+        entry_id=entry_id,
+        data={CONF_HOST: "192.168.1.1"},
+        options={CONF_PORT: 0, CONF_SSL: True, **(options or {})},
+    )
+    with (
+        patch.object(router_module, "ARBridge"),
+        patch.object(router_module, "get_store"),
+    ):
+        router = ARDevice(hass or Mock(), config_entry)
+
+    router.bridge = Mock()
+    router._sensors_store = AsyncMock()
+    router._clients_store = Mock(async_save=AsyncMock())
+    return router
+
+
+def _api_client(mac: str = FAKE_MAC, node: str = NODE_MAC) -> AsusClient:
+    """Create a connected client reported by the device."""
+
+    return AsusClient(
+        state=ConnectionState.CONNECTED,
+        description=AsusClientDescription(name="Phone", mac=mac),
+        connection=AsusClientConnectionWlan(
+            type=ConnectionType.WLAN_2G,
+            ip_address="192.168.1.2",
+            node=node,
+            rssi=-50,
+            since=SINCE,
+        ),
+    )
+
+
+def _signals(router: ARDevice) -> set[str]:
+    """Get all the dispatcher signals of the router."""
+
+    return {
+        router.signal_aimesh_new,
+        router.signal_aimesh_update,
+        router.signal_device_new,
+        router.signal_client_update(FAKE_MAC),
+        router.signal_pc_rules_new,
+        router.signal_pc_rules_update,
+    }
+
+
+def test_signals_scoped_to_entry() -> None:
+    """Test that routers do not share dispatcher signals."""
+
+    routers = [_router(entry_id=f"entry_{index}") for index in range(ROUTERS)]
+
+    signals = [_signals(router) for router in routers]
+
+    # A signal of one router never wakes up the others
+    for index, router_signals in enumerate(signals):
+        for other_signals in signals[index + 1 :]:
+            assert router_signals.isdisjoint(other_signals)
+
+
+@pytest.mark.asyncio
+async def test_revalidate_sensors() -> None:
+    """Test that the cached sensors are only replaced by a full discovery."""
+
+    router = _router()
+    router.bridge.cache_key = "key"
+    cached = {"cpu": ["cpu_total_usage"], "wlan": ["wlan_2ghz_channel"]}
+    reload = router.hass.config_entries.async_schedule_reload
+
+    # The device cannot be reached during the revalidation
+    router.bridge.async_discover_sensors = AsyncMock(
+        side_effect=AsusRouterTimeoutError()
+    )
+    await router._async_revalidate_sensors(cached)
+    router.bridge.async_discover_sensors.assert_awaited_once_with(strict=True)
+    router._sensors_store.async_save.assert_not_awaited()
+    reload.assert_not_called()
+
+    # The same sensors
+    router.bridge.async_discover_sensors = AsyncMock(return_value=cached)
+    await router._async_revalidate_sensors(cached)
+    router._sensors_store.async_save.assert_not_awaited()
+    reload.assert_not_called()
+
+    # The sensors have changed
+    discovered = {**cached, "wlan": []}
+    router.bridge.async_discover_sensors = AsyncMock(return_value=discovered)
+    await router._async_revalidate_sensors(cached)
+    router._sensors_store.async_save.assert_awaited_once()
+    assert (
+        router._sensors_store.async_save.await_args.args[0]["sensors"]
+        == discovered
+    )
+    reload.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_revalidated_data(
+    create_clientsession: AsyncPatch,
+    get_cookie_jar: SyncPatch,
+) -> None:
+    """Test that the revalidated data is pushed to the coordinator."""
+
+    create_clientsession(bridge_module)
+    get_cookie_jar()
+
+    api = Mock()
+    api.async_get_data = AsyncMock(return_value={"value": 1})
+
+    hass = Mock()
+    hass.loop = asyncio.get_running_loop()
+    hass.async_create_background_task = (
+        lambda target, name: hass.loop.create_task(target)
+    )
+
+    with patch.object(ARBridge, "_get_api", return_value=api):
+        bridge = ARBridge(hass, FAKE_CONFIGS, {CONF_STALE_DATA: True})
+    handler = ARSensorHandler(hass, bridge, {})
+    coordinator = await handler.get_coordinator(CPU, bridge._get_data_cpu)
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    assert coordinator.data == {"value": 1}
+
+    # The stale data is served first
+    api.async_get_data.return_value = {"value": 2}
+    await coordinator.async_refresh()
+    assert coordinator.data == {"value": 1}
+
+    # The fresh data reaches the coordinator without another poll
+    await asyncio.gather(*bridge._revalidating.values())
+    assert coordinator.data == {"value": 2}
+    listener.assert_called()
+
+    # Nothing is pushed when the data has not changed
+    listener.reset_mock()
+    await coordinator.async_refresh()
+    await asyncio.gather(*bridge._revalidating.values())
+    listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_remove_trackers() -> None:
+    """Test that a removed tracker is forgotten by all the indexes."""
+
+    hass = Mock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    router = _router(hass, {CONF_LATEST_CONNECTED: 1})
+    router.bridge.async_get_clients = AsyncMock(return_value={})
+
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients({FAKE_MAC: _api_client()})
+        router._apply_clients({FAKE_MAC: _api_client(node=ROAM_MAC)})
+    assert router.node_load(ROAM_MAC).clients == 1
+    assert router._latest_connected_list
+    assert router._roaming.roams(FAKE_MAC)
+
+    entity_reg = Mock()
+    entity_reg.async_get.return_value = er.RegistryEntry(
+        entity_id="device_tracker.phone",
+        unique_id=FAKE_MAC,
+        platform="asusrouter",
+        capabilities={"mac": FAKE_MAC},
+    )
+    with (
+        patch.object(router_module.er, "async_get", return_value=entity_reg),
+        patch.object(router_module, "async_dispatcher_send") as send,
+    ):
+        await router.remove_trackers(
+            raw={"entities": ["device_tracker.phone"]}
+        )
+
+    assert FAKE_MAC not in router._clients
+    assert router._expiry.next_expiry is None
+    assert router._latest_connected_list == []
+    assert router._latest_connected is None
+    assert router.node_load(ROAM_MAC).clients == 0
+    assert router._roaming.roams(FAKE_MAC) == []
+    assert router._clients_number == 0
+    send.assert_any_call(hass, router.signal_node_update(ROAM_MAC))
+
+
+def test_update_changed_clients_only() -> None:
+    """Test that the clients which cannot change are not updated."""
+
+    router = _router()
+    router._clients = {
+        FAKE_MAC: ARClient(FAKE_MAC),
+        ROAM_MAC: ARClient(ROAM_MAC),
+    }
+    router._clients_unsynced = set(router._clients)
+
+    # The known clients are updated once
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients({FAKE_MAC: _api_client()})
+    assert router._clients_number == 1
+    assert [client["mac"] for client in router._clients_list] == [FAKE_MAC]
+
+    # The client which is not reported is not checked anymore
+    router._clients[ROAM_MAC] = Mock(spec=ARClient)
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients({FAKE_MAC: _api_client()})
+        router._apply_clients({})
+    router._clients[ROAM_MAC].update.assert_not_called()
+    assert router._clients_number == 1
+
+    # A new client is counted on top of the connected ones
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients({NODE_MAC: _api_client(NODE_MAC)})
+    assert router._clients_number == len([FAKE_MAC, NODE_MAC])
+
+
+def test_rate_limited_events() -> None:
+    """Test that a flapping client gets its events in pairs."""
+
+    router = _router()
+    router._events_enabled = frozenset(
+        (
+            CONF_EVENT_CLIENTS_CHANGED,
+            CONF_EVENT_DEVICE_CONNECTED,
+            CONF_EVENT_DEVICE_DISCONNECTED,
+        )
+    )
+    identity = {"mac": FAKE_MAC}
+    fire = router.hass.bus.fire
+
+    with patch.object(router_module.time, "monotonic", return_value=0.0):
+        router.fire_event(CONF_EVENT_DEVICE_CONNECTED, identity)
+        router._fire_clients_changed()
+
+    # The disconnection is suppressed, but reported in the batch
+    fire.reset_mock()
+    with patch.object(router_module.time, "monotonic", return_value=1.0):
+        router.fire_event(CONF_EVENT_DEVICE_DISCONNECTED, identity)
+        router._fire_clients_changed()
+    fire.assert_called_once_with(
+        f"{DOMAIN}_{CONF_EVENT_CLIENTS_CHANGED}",
+        {"added": [], "removed": [FAKE_MAC]},
+    )
+
+    # The latest state is fired once the limit is over
+    fire.reset_mock()
+    with patch.object(
+        router_module.time, "monotonic", return_value=EVENT_RATE_LIMIT
+    ):
+        router._fire_clients_changed()
+    fire.assert_called_once_with(
+        f"{DOMAIN}_{CONF_EVENT_DEVICE_DISCONNECTED}", identity
+    )
+
+
+@pytest.mark.asyncio
+async def test_restore_clients() -> None:
+    """Test that the clients state is restored and written on close."""
+
+    router = _router()
+    router._events_enabled = frozenset(
+        (
+            CONF_EVENT_DEVICE_CONNECTED,
+            CONF_EVENT_DEVICE_DISCONNECTED,
+            CONF_EVENT_DEVICE_RECONNECTED,
+        )
+    )
+    router.bridge.async_disconnect = AsyncMock()
+
+    # State of the previous run
+    previous = ARClient(FAKE_MAC)
+    previous.update(_api_client())
+    snapshot = previous.snapshot()
+    snapshot["last_activity"] = SINCE.isoformat()
+    router._clients_store.async_load = AsyncMock(
+        return_value={STORAGE_CLIENTS: {FAKE_MAC: snapshot}}
+    )
+
+    # Clients known from the registry
+    router._clients = {FAKE_MAC: ARClient(FAKE_MAC)}
+    router._clients_unsynced = set(router._clients)
+    await router._async_restore_clients()
+
+    # The expiry is counted from the restored activity
+    assert router._clients[FAKE_MAC].state is True
+    assert router._expiry.next_expiry == SINCE + router._consider_home
+
+    # The restored client is counted
+    assert router._clients_number == 1
+    assert [client["mac"] for client in router._latest_connected_list] == [
+        FAKE_MAC
+    ]
+    assert router.node_load(NODE_MAC).clients == 1
+
+    # The first update does not reconnect the restored client
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients({FAKE_MAC: _api_client()})
+        router._apply_clients({FAKE_MAC: _api_client()})
+    router.hass.bus.fire.assert_not_called()
+    assert router._clients_number == 1
+    assert [client["mac"] for client in router._latest_connected_list] == [
+        FAKE_MAC
+    ]
+
+    # The pending state is written on close
+    with patch.object(router_module, "async_track_point_in_utc_time"):
+        router._apply_clients(
+            {FAKE_MAC: _api_client(), NODE_MAC: _api_client(NODE_MAC)}
+        )
+    assert router._clients_save_pending
+    await router.close()
+    router._clients_store.async_save.assert_awaited_once()
+    saved = router._clients_store.async_save.await_args.args[0]
+    assert set(saved[STORAGE_CLIENTS]) == {FAKE_MAC, NODE_MAC}
+    assert not router._clients_save_pending
+
+
+@pytest.mark.asyncio
+async def test_adaptive_intervals() -> None:
+    """Test that the interval follows the changes of the data."""
+
+    scan_interval = 30
+    max_interval = 60
+    rounds = 3
+
+    hass = Mock()
+    hass.loop = asyncio.get_running_loop()
+    data = {"value": 1}
+
+    async def _get_data(
+        method: Any,
+        listener: Any,
+    ) -> dict[str, Any]:
+        return await method()
+
+    async def _method() -> dict[str, Any]:
+        return dict(data)
+
+    bridge = Mock(async_get_data=_get_data)
+    handler = ARSensorHandler(
+        hass,
+        bridge,
+        {
+            CONF_ADAPTIVE_INTERVALS: True,
+            CONF_MAX_INTERVAL: max_interval,
+            CONF_SCAN_INTERVAL: scan_interval,
+        },
+    )
+    coordinator = await handler.get_coordinator(CPU, _method)
+    router = _router()
+    router._sensor_handler = handler
+
+    # The same data stretches the interval up to the maximum
+    await coordinator.async_refresh()
+    assert router.intervals == {CPU: scan_interval}
+    for _ in range(rounds):
+        await coordinator.async_refresh()
+    assert router.intervals == {CPU: max_interval}
+
+    # Changed data restores the configured interval
+    data["value"] = 2
+    await coordinator.async_refresh()
+    assert router.intervals == {CPU: scan_interval}
+
+
+@pytest.mark.asyncio
+async def test_update_all() -> None:
+    """Test that all the data is requested at once and signalled together."""
+
+    router = _router()
+    requests = ["aimesh", "clients", "parental_control"]
+    started: list[str] = []
+    all_started = asyncio.Event()
+    release = asyncio.Event()
+
+    def _fetch(name: str, result: dict[str, Any]) -> Any:
+        """Create a request which waits to be released."""
+
+        async def _request() -> dict[str, Any]:
+            started.append(name)
+            if len(started) == len(requests):
+                all_started.set()
+            await release.wait()
+            return result
+
+        return _request
+
+    router.bridge.async_get_clients = _fetch(
+        "clients", {FAKE_MAC: _api_client()}
+    )
+    router.bridge.async_get_aimesh_nodes = _fetch(
+        "aimesh", {NODE_MAC: AiMeshDevice(status=True, mac=NODE_MAC)}
+    )
+    router.bridge._get_data_parental_control = _fetch(
+        "parental_control", {"rules": {}}
+    )
+
+    with (
+        patch.object(router_module, "async_dispatcher_send") as send,
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        task = asyncio.create_task(router.update_all())
+
+        # All the requests are in flight at the same time
+        await asyncio.wait_for(all_started.wait(), 1)
+        assert sorted(started) == requests
+        send.assert_not_called()
+
+        release.set()
+        await task
+
+    # The data is applied in a fixed order
+    assert [call.args[1] for call in send.call_args_list] == [
+        router.signal_node_update(NODE_MAC),
+        router.signal_device_new,
+        router.signal_aimesh_update,
+        router.signal_aimesh_new,
+        router.signal_pc_rules_update,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_expire_clients() -> None:
+    """Test that a client is disconnected when its expiry time comes."""
+
+    router = _router()
+    router._events_enabled = frozenset((CONF_EVENT_DEVICE_DISCONNECTED,))
+
+    with patch.object(router_module, "async_track_point_in_utc_time") as track:
+        router._apply_clients({FAKE_MAC: _api_client()})
+    client = router._clients[FAKE_MAC]
+    assert client.last_activity is not None
+
+    # A single timer for the expiry after the consider home time
+    track.assert_called_once()
+    expiry = track.call_args.args[2]
+    assert (
+        timedelta(0)
+        <= expiry - (client.last_activity + router._consider_home)
+        < timedelta(seconds=1)
+    )
+
+    # Nothing expires before the time
+    with (
+        patch.object(router_module, "async_dispatcher_send") as send,
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        await router._async_expire_clients(expiry - timedelta(seconds=1))
+    assert client.state is True
+    send.assert_not_called()
+
+    # The client is disconnected at the expiry time
+    with (
+        patch.object(router_module, "async_dispatcher_send") as send,
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        await router._async_expire_clients(expiry)
+    assert client.state is False
+    assert router._clients_number == 0
+    router.hass.bus.fire.assert_called_once()
+    assert router.hass.bus.fire.call_args.args[0] == (
+        f"{DOMAIN}_{CONF_EVENT_DEVICE_DISCONNECTED}"
+    )
+    send.assert_any_call(router.hass, router.signal_client_update(FAKE_MAC))
+    assert router._expiry.next_expiry is None
+
+
+@pytest.mark.asyncio
+async def test_node_sensors() -> None:
+    """Test that the AiMesh node sensors follow the node load."""
+
+    router = _router()
+    listeners: dict[str, list[Any]] = {}
+
+    def _connect(hass: Any, signal: str, target: Any) -> Mock:
+        listeners.setdefault(signal, []).append(target)
+        return Mock()
+
+    def _send(hass: Any, signal: str) -> None:
+        for target in listeners.get(signal, []):
+            target()
+
+    router._apply_nodes(
+        {NODE_MAC: AiMeshDevice(status=True, mac=NODE_MAC, model="RT-AX88U")}
+    )
+    node = router._aimesh[NODE_MAC]
+    sensors = [AMClientsSensor(router, node), AMRssiSensor(router, node)]
+    with patch.object(sensor_module, "async_dispatcher_connect", _connect):
+        for sensor in sensors:
+            sensor.async_write_ha_state = Mock()
+            await sensor.async_added_to_hass()
+
+    # A client connects to the node
+    with (
+        patch.object(router_module, "async_dispatcher_send", _send),
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        router._send_signals(router._apply_clients({FAKE_MAC: _api_client()}))
+
+    for sensor in sensors:
+        sensor.async_write_ha_state.assert_called_once()
+    clients, rssi = sensors
+    assert clients.native_value == 1
+    assert clients.extra_state_attributes == {ConnectionType.WLAN_2G.value: 1}
+    assert rssi.native_value == _api_client().connection.rssi
+    assert rssi.extra_state_attributes == {"clients": 1}
+
+    # The client roams to another node
+    for sensor in sensors:
+        sensor.async_write_ha_state.reset_mock()
+    with (
+        patch.object(router_module, "async_dispatcher_send", _send),
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        router._send_signals(
+            router._apply_clients({FAKE_MAC: _api_client(node=ROAM_MAC)})
+        )
+
+    for sensor in sensors:
+        sensor.async_write_ha_state.assert_called_once()
+    assert clients.native_value == 0
+    assert rssi.native_value is None
+
+
+@pytest.mark.asyncio
+async def test_returning_client() -> None:
+    """Test that the tracker of a removed stale client is enabled again."""
+
+    router = _router(options={CONF_CLIENTS_LIMIT: 1})
+    router._clients = {mac: ARClient(mac) for mac in (FAKE_MAC, ROAM_MAC)}
+    entries = {
+        "device_tracker.phone": er.RegistryEntry(
+            entity_id="device_tracker.phone",
+            unique_id=ROAM_MAC,
+            platform="asusrouter",
+            capabilities={"mac": ROAM_MAC},
+        )
+    }
+
+    def _update_entity(entity_id: str, **changes: Any) -> None:
+        entries[entity_id] = attr.evolve(entries[entity_id], **changes)
+
+    entity_reg = Mock(async_get=entries.get)
+    entity_reg.async_update_entity = Mock(side_effect=_update_entity)
+
+    with (
+        patch.object(router_module.er, "async_get", return_value=entity_reg),
+        patch.object(
+            router_module.er,
+            "async_entries_for_config_entry",
+            side_effect=lambda *_: list(entries.values()),
+        ),
+        patch.object(router_module, "async_track_point_in_utc_time"),
+    ):
+        # The client over the limit is removed
+        router._evict_clients()
+        assert ROAM_MAC not in router._clients
+        assert (
+            entries["device_tracker.phone"].disabled_by
+            is er.RegistryEntryDisabler.INTEGRATION
+        )
+
+        # The client is back
+        router._apply_clients({ROAM_MAC: _api_client(mac=ROAM_MAC)})
+
+    assert ROAM_MAC in router._clients
+    assert entries["device_tracker.phone"].disabled_by is None
+    assert not router._evicted_trackers
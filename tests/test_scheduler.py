@@ -0,0 +1,251 @@
+"""Tests for the scheduler module."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.asusrouter import scheduler as scheduler_module
+from custom_components.asusrouter.const import (
+    SCHEDULER_BATCH_WINDOW,
+    SCHEDULER_JITTER,
+)
+from custom_components.asusrouter.scheduler import ARPollScheduler
+
+INTERVAL = 30.0
+MAX_IN_FLIGHT = 2
+GROUPS = 4
+ROUNDS = 50
+
+
+class FakeTimer:
+    """Fake loop clock and timers of Home Assistant."""
+
+    def __init__(self) -> None:
+        """Initialize the fake timer."""
+
+        self.now = 0.0
+        self.delays: list[float] = []
+        self.actions: list[Any] = []
+        self.unsubs: list[Mock] = []
+
+        self.hass = Mock()
+        self.hass.loop.time = lambda: self.now
+        self.hass.async_create_background_task = (
+            lambda target, name: asyncio.get_running_loop().create_task(target)
+        )
+
+    def call_later(self, hass: Any, delay: float, action: Any) -> Mock:
+        """Record the timer instead of starting it."""
+
+        self.delays.append(delay)
+        self.actions.append(action)
+        self.unsubs.append(Mock())
+        return self.unsubs[-1]
+
+    def fire(self, now: float) -> None:
+        """Move the clock and fire the latest timer."""
+
+        self.now = now
+        self.actions[-1](None)
+
+
+@pytest.fixture(name="timer")
+def fake_timer() -> Any:
+    """Patch the timers of the scheduler."""
+
+    timer = FakeTimer()
+    with patch.object(
+        scheduler_module, "async_call_later", side_effect=timer.call_later
+    ):
+        yield timer
+
+
+def _coordinator(
+    release: asyncio.Event | None = None,
+    listeners: bool = True,
+) -> Mock:
+    """Create a coordinator, optionally blocked until released."""
+
+    async def _refresh() -> None:
+        if release is not None:
+            await release.wait()
+
+    return Mock(
+        async_refresh=AsyncMock(side_effect=_refresh),
+        _listeners={1: (Mock(), None)} if listeners else {},
+    )
+
+
+async def _settle() -> None:
+    """Let the started refreshes run."""
+
+    for _ in range(GROUPS):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_batch_window(timer: FakeTimer) -> None:
+    """Test that the groups due within the window are batched."""
+
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    first = _coordinator()
+    close = _coordinator()
+    later = _coordinator()
+    scheduler.add("first", first, timedelta(seconds=INTERVAL))
+    scheduler.add(
+        "close",
+        close,
+        timedelta(seconds=INTERVAL + SCHEDULER_BATCH_WINDOW / 2),
+    )
+    scheduler.add("later", later, timedelta(seconds=INTERVAL * 2))
+
+    with patch.object(scheduler_module.random, "uniform", return_value=0.0):
+        scheduler.async_start()
+        assert timer.delays[-1] == INTERVAL
+
+        timer.fire(INTERVAL)
+        await asyncio.gather(*scheduler._tasks)
+
+        # The next timer is set for the group which was not due
+        assert timer.delays[-1] == INTERVAL
+
+    first.async_refresh.assert_awaited_once()
+    close.async_refresh.assert_awaited_once()
+    later.async_refresh.assert_not_awaited()
+
+    scheduler.async_stop()
+    timer.unsubs[-1].assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_jitter(timer: FakeTimer) -> None:
+    """Test that the jitter is added within its bounds."""
+
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    scheduler.add("group", _coordinator(), timedelta(seconds=INTERVAL))
+    scheduler.async_start()
+
+    for _ in range(ROUNDS):
+        scheduler._schedule()
+
+    assert all(
+        INTERVAL <= delay <= INTERVAL + SCHEDULER_JITTER
+        for delay in timer.delays
+    )
+
+    # The timer is never set before the group is due
+    timer.now = INTERVAL * 2
+    with patch.object(scheduler_module.random, "uniform", return_value=0.0):
+        scheduler._schedule()
+    assert timer.delays[-1] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_set_interval(timer: FakeTimer) -> None:
+    """Test that a new interval moves the next poll."""
+
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    scheduler.add("group", _coordinator(), timedelta(seconds=INTERVAL))
+
+    with patch.object(scheduler_module.random, "uniform", return_value=0.0):
+        scheduler.async_start()
+        assert timer.delays[-1] == INTERVAL
+
+        # The previous timer is replaced
+        scheduler.set_interval("group", timedelta(seconds=INTERVAL / 2))
+        timer.unsubs[0].assert_called_once()
+        assert timer.delays[-1] == INTERVAL / 2
+        assert scheduler.intervals == {"group": INTERVAL / 2}
+
+        # The same interval does not reschedule
+        timers = len(timer.delays)
+        scheduler.set_interval("group", timedelta(seconds=INTERVAL / 2))
+        assert len(timer.delays) == timers
+
+        # Unknown groups are ignored
+        scheduler.set_interval("unknown", timedelta(seconds=INTERVAL))
+        assert scheduler.get_interval("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_in_flight_skip(timer: FakeTimer) -> None:
+    """Test that a group is skipped while its refresh is in flight."""
+
+    release = asyncio.Event()
+    coordinator = _coordinator(release)
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    scheduler.add("group", coordinator, timedelta(seconds=INTERVAL))
+    scheduler.async_start()
+
+    timer.fire(INTERVAL)
+    await _settle()
+    assert scheduler._groups["group"].in_flight
+
+    # The next round is skipped, but the schedule goes on
+    timer.fire(INTERVAL * 2)
+    await _settle()
+    coordinator.async_refresh.assert_awaited_once()
+    assert scheduler._groups["group"].next_due == INTERVAL * 3
+
+    release.set()
+    await asyncio.gather(*scheduler._tasks)
+    assert not scheduler._groups["group"].in_flight
+
+    # The group is polled again once the refresh is finished
+    coordinator.async_refresh.reset_mock()
+    timer.fire(INTERVAL * 3)
+    await asyncio.gather(*scheduler._tasks)
+    coordinator.async_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight(timer: FakeTimer) -> None:
+    """Test that the number of refreshes in flight is limited."""
+
+    release = asyncio.Event()
+    coordinators = [_coordinator(release) for _ in range(GROUPS)]
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    for index, coordinator in enumerate(coordinators):
+        scheduler.add(str(index), coordinator, timedelta(seconds=INTERVAL))
+    scheduler.async_start()
+
+    timer.fire(INTERVAL)
+    await _settle()
+    assert (
+        sum(
+            coordinator.async_refresh.await_count
+            for coordinator in coordinators
+        )
+        == MAX_IN_FLIGHT
+    )
+
+    release.set()
+    await asyncio.gather(*scheduler._tasks)
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_no_listeners(timer: FakeTimer) -> None:
+    """Test that the groups without entities are not polled."""
+
+    listened = _coordinator()
+    disabled = _coordinator(listeners=False)
+    scheduler = ARPollScheduler(timer.hass, MAX_IN_FLIGHT)
+    scheduler.add("listened", listened, timedelta(seconds=INTERVAL))
+    scheduler.add("disabled", disabled, timedelta(seconds=INTERVAL))
+    scheduler.async_start()
+
+    timer.fire(INTERVAL)
+    await asyncio.gather(*scheduler._tasks)
+    listened.async_refresh.assert_awaited_once()
+    disabled.async_refresh.assert_not_awaited()
+
+    # The group is polled once an entity is enabled
+    disabled._listeners[1] = (Mock(), None)
+    timer.fire(INTERVAL * 2)
+    await asyncio.gather(*scheduler._tasks)
+    disabled.async_refresh.assert_awaited_once()